@@ -23,14 +23,14 @@ except ImportError:
     load_dotenv(Path(__file__).resolve().parent / ".env")
 
 from data_store import get_available_dates, get_news, save_script, get_scripts
-from script_generator import generate_script
+from script_generator import generate_script, generate_scripts
 
 # Phase 1 리서치 함수 의존성 제거
 HAS_RESEARCHER = False
 
 # Phase 3 영상 생성
 try:
-    from video_pipeline import run_pipeline as generate_video
+    from video_pipeline import run_pipeline as generate_video, promote_draft
     HAS_VIDEO = True
 except ImportError:
     HAS_VIDEO = False
@@ -351,15 +351,40 @@ elif page == "대본 생성":
     with col2:
         duration = st.radio("길이", [30, 45, 60], horizontal=True, format_func=lambda x: f"{x}초")
 
+    refresh = st.checkbox("캐시 무시하고 새로 생성", value=False,
+                          help="같은 뉴스/설정으로 만든 대본이 캐시에 있어도 Gemini를 다시 호출합니다.")
     if st.button("대본 생성", type="primary", use_container_width=True):
         with st.spinner("Gemini로 대본 생성 중..."):
             try:
-                script = generate_script(API_KEY, selected_news, tone, duration)
+                script = generate_script(API_KEY, selected_news, tone, duration, refresh=refresh)
                 st.session_state["generated_script"] = script
                 st.session_state["selected_news"] = selected_news
             except Exception as e:
                 st.error(f"대본 생성 실패: {e}")
 
+    with st.expander("여러 뉴스/말투/길이 한 번에 비교"):
+        batch_ranks = st.multiselect(
+            "뉴스", [n["rank"] for n in top_news], default=[selected_news["rank"]],
+            format_func=lambda r: f"#{r}",
+        )
+        batch_tones = st.multiselect("말투", ["유머러스", "분석적", "열정적"], default=["유머러스", "분석적", "열정적"])
+        batch_durations = st.multiselect("길이", [30, 45, 60], default=[duration], format_func=lambda x: f"{x}초")
+        total = len(batch_ranks) * len(batch_tones) * len(batch_durations)
+        if st.button(f"{total}개 대본 동시 생성", use_container_width=True, disabled=total == 0):
+            progress = st.progress(0.0)
+            for i, item in enumerate(generate_scripts(
+                API_KEY, top_news, batch_tones, batch_durations, batch_ranks, refresh=refresh,
+            )):
+                progress.progress((i + 1) / total, text=f"{i + 1}/{total} 완료")
+                label = f"#{item.rank} · {item.tone} · {item.duration}초"
+                if item.error:
+                    st.error(f"{label}: {item.error}")
+                    continue
+                with st.container(border=True):
+                    st.markdown(f"**{label}** — {item.news.get('headline', '')}")
+                    st.info(item.script.get("hook", ""))
+                    st.write(item.script.get("full_script", ""))
+
     if "generated_script" in st.session_state:
         script = st.session_state["generated_script"]
 
@@ -405,8 +430,10 @@ elif page == "대본 생성":
         if col_video is not None:
             with col_video:
                 voice = st.selectbox("음성", ["male", "female"], format_func=lambda x: "남성" if x == "male" else "여성", label_visibility="collapsed")
+                draft = st.checkbox("초안 미리보기 (540x960, 빠른 렌더링)", value=True)
                 if st.button("영상 만들기", type="primary", use_container_width=True):
-                    with st.spinner("영상 생성 중... (1~3분 소요)"):
+                    spinner_msg = "초안 영상 생성 중..." if draft else "영상 생성 중... (1~3분 소요)"
+                    with st.spinner(spinner_msg):
                         try:
                             players = selected_news.get("players", [])
                             player_name = players[0] if players else None
@@ -419,9 +446,11 @@ elif page == "대본 생성":
                                 voice_type=voice,
                                 player_name=player_name,
                                 stats=stats if isinstance(stats, dict) else None,
+                                draft=draft,
                             )
                             st.session_state["video_path"] = video_path
-                            st.success("영상 생성 완료!")
+                            st.session_state["video_is_draft"] = draft
+                            st.success("초안 생성 완료!" if draft else "영상 생성 완료!")
                         except Exception as e:
                             st.error(f"영상 생성 실패: {e}")
 
@@ -438,94 +467,108 @@ elif page == "대본 생성":
                 st.subheader("생성된 영상")
                 st.video(str(video_file))
 
-                col_dl, col_upload = st.columns(2)
-
-                with col_dl:
-                    with open(video_file, "rb") as f:
-                        st.download_button(
-                            "영상 다운로드 (.mp4)",
-                            data=f,
-                            file_name=f"mlb_shorts_{selected_date}.mp4",
-                            mime="video/mp4",
-                            use_container_width=True,
-                        )
-
-                # YouTube 업로드 섹션
-                if HAS_UPLOAD:
-                    with col_upload:
-                        privacy = st.selectbox(
-                            "공개 설정",
-                            ["private", "unlisted", "public"],
-                            format_func=lambda x: {"private": "비공개", "unlisted": "일부 공개", "public": "전체 공개"}[x],
-                            label_visibility="collapsed",
-                        )
-                        if st.button("YouTube 업로드", type="primary", use_container_width=True):
-                            # 메타데이터 자동 생성
-                            with st.spinner("메타데이터 생성 + YouTube 업로드 중..."):
-                                try:
-                                    news_for_meta = st.session_state.get("selected_news", {})
-                                    meta = generate_metadata(
-                                        API_KEY,
-                                        edited_script,
-                                        headline=news_for_meta.get("headline", ""),
-                                    )
-                                    st.session_state["upload_metadata"] = meta
-
-                                    yt_meta = meta.get("youtube", {})
-                                    result = upload_to_youtube(
-                                        video_path=str(video_file),
-                                        title=yt_meta.get("title", f"MLB 숏폼 - {selected_date}"),
-                                        description=yt_meta.get("description", ""),
-                                        tags=yt_meta.get("tags", []),
-                                        privacy=privacy,
-                                    )
-                                    st.session_state["upload_result"] = result
-
-                                    # 히스토리 저장
-                                    save_history(
-                                        date=selected_date,
-                                        headline=news_for_meta.get("headline", ""),
-                                        video_path=str(video_file),
-                                        upload_result=result,
-                                        metadata=meta,
-                                        tone=tone,
-                                        duration=duration,
-                                    )
-
-                                    st.success(f"업로드 완료! {result['url']}")
-                                    st.balloons()
-                                except FileNotFoundError as e:
-                                    st.error(str(e))
-                                    st.info(
-                                        "YouTube 업로드를 위해 OAuth 설정이 필요합니다:\n\n"
-                                        "1. Google Cloud Console에서 OAuth 2.0 클라이언트 ID 생성\n"
-                                        "2. client_secret.json 파일을 phase-4_integration/ 에 저장\n"
-                                        "3. 다시 업로드 버튼 클릭"
-                                    )
-                                except Exception as e:
-                                    st.error(f"업로드 실패: {e}")
-
-                    # 업로드 결과 표시
-                    if "upload_result" in st.session_state:
-                        result = st.session_state["upload_result"]
-                        st.markdown(f"**YouTube URL:** [{result['url']}]({result['url']})")
-
-                    # 메타데이터 미리보기
-                    if "upload_metadata" in st.session_state:
-                        meta = st.session_state["upload_metadata"]
-                        with st.expander("생성된 메타데이터"):
-                            yt = meta.get("youtube", {})
-                            st.markdown(f"**YouTube 제목:** {yt.get('title', '')}")
-                            st.markdown(f"**설명:** {yt.get('description', '')}")
-                            st.markdown(f"**태그:** {', '.join(yt.get('tags', []))}")
-
-                            ig = meta.get("instagram", {})
-                            if ig:
-                                st.markdown(f"**Instagram:** {ig.get('caption', '')}")
-
-                            tw = meta.get("twitter", {})
-                            if tw:
-                                st.markdown(f"**Twitter:** {tw.get('tweet_text', '')}")
+                # 초안 → 최종 품질 렌더링 (TTS/배경 재사용)
+                if st.session_state.get("video_is_draft"):
+                    st.caption("초안(540x960)입니다. 자막/타이밍 확인 후 최종 렌더링하세요. 다운로드/업로드는 최종 렌더링 후 가능합니다.")
+                    if st.button("최종 품질로 렌더링", type="primary", use_container_width=True):
+                        with st.spinner("최종 영상 렌더링 중... (TTS/배경 재사용)"):
+                            try:
+                                final_path = promote_draft(video_file.parent)
+                                st.session_state["video_path"] = final_path
+                                st.session_state["video_is_draft"] = False
+                                st.rerun()
+                            except Exception as e:
+                                st.error(f"최종 렌더링 실패: {e}")
+                else:
+                    # 초안(저화질 미리보기)은 다운로드/업로드 불가 - 최종 렌더링 후에만 표시
+                    col_dl, col_upload = st.columns(2)
+
+                    with col_dl:
+                        with open(video_file, "rb") as f:
+                            st.download_button(
+                                "영상 다운로드 (.mp4)",
+                                data=f,
+                                file_name=f"mlb_shorts_{selected_date}.mp4",
+                                mime="video/mp4",
+                                use_container_width=True,
+                            )
+
+                    # YouTube 업로드 섹션
+                    if HAS_UPLOAD:
+                        with col_upload:
+                            privacy = st.selectbox(
+                                "공개 설정",
+                                ["private", "unlisted", "public"],
+                                format_func=lambda x: {"private": "비공개", "unlisted": "일부 공개", "public": "전체 공개"}[x],
+                                label_visibility="collapsed",
+                            )
+                            if st.button("YouTube 업로드", type="primary", use_container_width=True):
+                                # 메타데이터 자동 생성
+                                with st.spinner("메타데이터 생성 + YouTube 업로드 중..."):
+                                    try:
+                                        news_for_meta = st.session_state.get("selected_news", {})
+                                        meta = generate_metadata(
+                                            API_KEY,
+                                            edited_script,
+                                            headline=news_for_meta.get("headline", ""),
+                                        )
+                                        st.session_state["upload_metadata"] = meta
+
+                                        yt_meta = meta.get("youtube", {})
+                                        result = upload_to_youtube(
+                                            video_path=str(video_file),
+                                            title=yt_meta.get("title", f"MLB 숏폼 - {selected_date}"),
+                                            description=yt_meta.get("description", ""),
+                                            tags=yt_meta.get("tags", []),
+                                            privacy=privacy,
+                                        )
+                                        st.session_state["upload_result"] = result
+
+                                        # 히스토리 저장
+                                        save_history(
+                                            date=selected_date,
+                                            headline=news_for_meta.get("headline", ""),
+                                            video_path=str(video_file),
+                                            upload_result=result,
+                                            metadata=meta,
+                                            tone=tone,
+                                            duration=duration,
+                                        )
+
+                                        st.success(f"업로드 완료! {result['url']}")
+                                        st.balloons()
+                                    except FileNotFoundError as e:
+                                        st.error(str(e))
+                                        st.info(
+                                            "YouTube 업로드를 위해 OAuth 설정이 필요합니다:\n\n"
+                                            "1. Google Cloud Console에서 OAuth 2.0 클라이언트 ID 생성\n"
+                                            "2. client_secret.json 파일을 phase-4_integration/ 에 저장\n"
+                                            "3. 다시 업로드 버튼 클릭"
+                                        )
+                                    except Exception as e:
+                                        st.error(f"업로드 실패: {e}")
+
+                        # 업로드 결과 표시
+                        if "upload_result" in st.session_state:
+                            result = st.session_state["upload_result"]
+                            st.markdown(f"**YouTube URL:** [{result['url']}]({result['url']})")
+
+                        # 메타데이터 미리보기
+                        if "upload_metadata" in st.session_state:
+                            meta = st.session_state["upload_metadata"]
+                            with st.expander("생성된 메타데이터"):
+                                yt = meta.get("youtube", {})
+                                st.markdown(f"**YouTube 제목:** {yt.get('title', '')}")
+                                st.markdown(f"**설명:** {yt.get('description', '')}")
+                                st.markdown(f"**태그:** {', '.join(yt.get('tags', []))}")
+
+                                ig = meta.get("instagram", {})
+                                if ig:
+                                    st.markdown(f"**Instagram:** {ig.get('caption', '')}")
+
+                                tw = meta.get("twitter", {})
+                                if tw:
+                                    st.markdown(f"**Twitter:** {tw.get('tweet_text', '')}")
 
 
 # ── 페이지 3: 저장된 대본 ──
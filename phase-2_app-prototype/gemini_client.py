@@ -0,0 +1,105 @@
+"""
+Gemini 클라이언트 공용 풀
+- API 키별 genai.Client 하나를 프로세스 전체에서 공유 (호출마다 클라이언트/TLS 연결을 새로 만들지 않음)
+- 클라이언트는 스레드 간 공유 (배치 생성의 작업 스레드들도 같은 연결 풀 사용)
+- 요청 수 / 새 연결 수를 집계해 연결 재사용률 확인 (connection_stats)
+- 분당 요청 수 제한 (RateLimiter, 배치 생성용)
+
+script_generator(Phase 2)와 metadata_generator(Phase 4)가 함께 사용한다.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+import httpx
+from google import genai
+from google.genai import types
+
+# 분당 요청 한도 (gemini-2.0-flash-lite 무료 등급 기준)
+DEFAULT_REQUESTS_PER_MINUTE = float(os.environ.get("MLB_GEMINI_RPM", "30"))
+
+_clients: dict[str, genai.Client] = {}
+_lock = threading.Lock()
+
+
+@dataclass
+class ConnectionStats:
+    """클라이언트/연결 재사용 집계."""
+
+    clients_created: int = 0
+    clients_reused: int = 0
+    requests: int = 0
+    connections_opened: int = 0
+
+    @property
+    def connections_reused(self) -> int:
+        """이미 열린 연결로 보낸 요청 수."""
+        return max(0, self.requests - self.connections_opened)
+
+    def summary(self) -> str:
+        return (
+            f"클라이언트 생성 {self.clients_created} / 재사용 {self.clients_reused}, "
+            f"요청 {self.requests} (새 연결 {self.connections_opened}, 연결 재사용 {self.connections_reused})"
+        )
+
+
+_stats = ConnectionStats()
+_stats_lock = threading.Lock()
+
+
+def _count(field: str) -> None:
+    with _stats_lock:
+        setattr(_stats, field, getattr(_stats, field) + 1)
+
+
+def _trace(event: str, info: dict) -> None:
+    if event == "connection.connect_tcp.complete":
+        _count("connections_opened")
+
+
+def _on_request(request: httpx.Request) -> None:
+    _count("requests")
+    request.extensions["trace"] = _trace
+
+
+def _new_client(api_key: str) -> genai.Client:
+    http_options = types.HttpOptions(client_args={"event_hooks": {"request": [_on_request]}})
+    _count("clients_created")
+    return genai.Client(api_key=api_key, http_options=http_options)
+
+
+def get_client(api_key: str) -> genai.Client:
+    """API 키별 공용 클라이언트 (동기 호출용, 스레드 간 공유)."""
+    with _lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = _clients[api_key] = _new_client(api_key)
+            return client
+    _count("clients_reused")
+    return client
+
+
+class RateLimiter:
+    """요청 간 최소 간격을 지키는 속도 제한 (스레드 간 공유 가능)."""
+
+    def __init__(self, requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE):
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """다음 요청 차례까지 대기."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def connection_stats() -> ConnectionStats:
+    """현재까지의 집계 (사본)."""
+    with _stats_lock:
+        return ConnectionStats(**vars(_stats))
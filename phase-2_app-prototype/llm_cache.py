@@ -0,0 +1,74 @@
+"""
+Gemini 응답 로컬 캐시 (선택 사용)
+- 키: (프롬프트 템플릿, 완성된 프롬프트, 모델, temperature, 최대 토큰) 해시
+- TTL이 지난 항목은 무시, 용량 초과 시 오래 사용하지 않은 항목부터 삭제
+- 같은 뉴스/설정으로 재실행(영상/업로드 실패 후 재시도 등)할 때 LLM 호출 생략
+- 해시/LRU 정리/캐시 루트는 Phase 3 cache_store와 공유 (캐시 위치: <캐시 루트>/llm)
+
+환경변수:
+    MLB_LLM_CACHE=1                 기본으로 캐시 사용 (호출 인자 use_cache로 개별 지정 가능)
+    MLB_LLM_CACHE_TTL_HOURS=24
+    MLB_LLM_CACHE_MAX_MB=50
+    MLB_CACHE_DIR                   캐시 루트 (기본: phase-3_video-pipeline/cache)
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+# 캐시 공통 유틸(cache_store)은 Phase 3 src에 있음
+_PHASE3_SRC = str(Path(__file__).resolve().parent.parent / "phase-3_video-pipeline" / "src")
+if _PHASE3_SRC not in sys.path:
+    sys.path.append(_PHASE3_SRC)
+
+from cache_store import cache_dir, content_hash, evict_lru, touch
+
+CACHE_NAME = "llm"
+CACHE_TTL = float(os.environ.get("MLB_LLM_CACHE_TTL_HOURS", "24")) * 3600
+CACHE_MAX_BYTES = int(os.environ.get("MLB_LLM_CACHE_MAX_MB", "50")) * 1024 * 1024
+ENABLED_BY_DEFAULT = os.environ.get("MLB_LLM_CACHE", "").lower() in ("1", "true", "yes")
+
+
+def is_enabled(use_cache: bool | None = None) -> bool:
+    """use_cache가 None이면 MLB_LLM_CACHE 환경변수 기준."""
+    return ENABLED_BY_DEFAULT if use_cache is None else use_cache
+
+
+def cache_key(
+    template: str, prompt: str, model: str, temperature: float, max_output_tokens: int, *extra
+) -> str:
+    """응답 캐시 키 (입력값 순서까지 반영한 SHA-256)."""
+    return content_hash(template, prompt, model, temperature, max_output_tokens, *extra)
+
+
+def _path(key: str) -> Path:
+    return cache_dir(CACHE_NAME) / f"{key[:32]}.json"
+
+
+def lookup(key: str) -> str | None:
+    """TTL 안의 캐시된 응답 텍스트 (없거나 만료됐으면 None)."""
+    path = _path(key)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        if entry["key"] != key:
+            return None
+        if time.time() - entry["created_at"] >= CACHE_TTL:
+            path.unlink(missing_ok=True)
+            return None
+        touch(path)
+        return entry["text"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def store(key: str, text: str) -> None:
+    """응답 텍스트 저장 (임시 파일에 쓰고 교체) 후 용량 정리."""
+    path = _path(key)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"key": key, "created_at": time.time(), "text": text}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    evict_lru(path.parent, CACHE_MAX_BYTES, "*.json")
@@ -2,13 +2,26 @@
 Gemini API로 MLB 숏폼 대본 생성
 - 3가지 말투: 유머러스, 분석적, 열정적
 - 3가지 길이: 30초, 45초, 60초
+- 선택: 같은 프롬프트/설정의 응답은 로컬 캐시에서 재사용 (llm_cache)
+- 응답은 JSON 스키마(ScriptResponse)로 요청하고 검증 (structured_output)
+- 여러 뉴스 × 말투 × 길이 조합을 동시 생성 (generate_scripts, 끝나는 대로 반환)
 """
 
-import json
-import re
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 
-from google import genai
-from google.genai import types
+from pydantic import BaseModel, Field
+
+from gemini_client import DEFAULT_REQUESTS_PER_MINUTE, RateLimiter
+from structured_output import generate_structured
+
+MODEL = "gemini-2.0-flash-lite"
+TEMPERATURE = 0.9
+MAX_OUTPUT_TOKENS = 2048
+# 배치 생성 동시 요청 수
+BATCH_CONCURRENCY = int(os.environ.get("MLB_SCRIPT_BATCH_CONCURRENCY", "4"))
 
 TONE_PROMPTS = {
     "유머러스": "당신은 유머감각이 넘치는 MLB 유튜브 크리에이터입니다. 친근하고 유머러스하게, 드립과 비유를 활용하세요.",
@@ -22,31 +35,68 @@ DURATION_WORDS = {
     60: 180,
 }
 
-SCRIPT_PROMPT = """\
-{tone_description}
-
-다음 MLB 뉴스를 기반으로 유튜브 쇼츠/릴스 대본을 작성해주세요.
-
+# 프롬프트 구성 요소 (대본 단독 / 대본+메타데이터 동시 생성 프롬프트가 공유)
+NEWS_INFO = """\
 뉴스 정보:
 - 제목: {headline}
 - 요약: {summary}
+"""
 
-조건:
+SCRIPT_CONDITIONS = """\
 - 길이: {duration}초 분량 (약 {word_count}단어 기준)
 - 구조: 훅(첫 5초, 시청자를 사로잡는 한마디) -> 본문(핵심 내용) -> 마무리(구독/좋아요 유도)
 - 제공된 뉴스 정보만을 활용하여 한국어로 작성
+"""
 
-아래 JSON 형식으로만 출력하세요:
+JSON_ONLY = "아래 JSON 형식으로만 출력하세요:\n\n"
 
-{{
+# 대본 JSON 예시의 필드 부분 (바깥 중괄호 제외, 다른 필드를 이어 붙일 수 있도록)
+SCRIPT_JSON_FIELDS = """\
   "hook": "첫 5초 대사 (시청자를 사로잡는 한마디)",
   "body": "본문 대사 (핵심 내용 전달)",
   "closing": "마무리 대사 (구독/좋아요 유도)",
   "full_script": "전체 대본 (hook + body + closing을 자연스럽게 이어붙인 것)",
   "estimated_duration": {duration},
-  "suggested_hashtags": ["#태그1", "#태그2", "#태그3", "#태그4", "#태그5"]
-}}
-"""
+  "suggested_hashtags": ["#태그1", "#태그2", "#태그3", "#태그4", "#태그5"]"""
+
+SCRIPT_PROMPT = (
+    "{tone_description}\n\n"
+    "다음 MLB 뉴스를 기반으로 유튜브 쇼츠/릴스 대본을 작성해주세요.\n\n"
+    + NEWS_INFO
+    + "\n조건:\n" + SCRIPT_CONDITIONS
+    + "\n" + JSON_ONLY
+    + "{{\n" + SCRIPT_JSON_FIELDS + "\n}}\n"
+)
+
+class ScriptResponse(BaseModel):
+    """대본 응답 형식."""
+
+    hook: str = ""
+    body: str = ""
+    closing: str = ""
+    full_script: str = Field(min_length=1)
+    estimated_duration: int = 0
+    suggested_hashtags: list[str] = Field(default_factory=list)
+
+
+def script_meta(news: dict, tone: str, duration: int) -> dict:
+    """대본 dict의 "_meta" 항목."""
+    return {
+        "news_headline": news.get("headline", ""),
+        "tone": tone,
+        "duration": duration,
+    }
+
+
+def script_prompt_fields(news: dict, tone: str, duration: int) -> dict:
+    """SCRIPT_PROMPT (및 같은 자리표시자를 쓰는 프롬프트) 채우기 값."""
+    return {
+        "tone_description": TONE_PROMPTS.get(tone, TONE_PROMPTS["유머러스"]),
+        "headline": news.get("headline", ""),
+        "summary": news.get("summary", ""),
+        "duration": duration,
+        "word_count": DURATION_WORDS.get(duration, 90),
+    }
 
 
 def generate_script(
@@ -54,47 +104,101 @@ def generate_script(
     news: dict,
     tone: str = "유머러스",
     duration: int = 30,
+    use_cache: bool | None = None,
+    refresh: bool = False,
+    rate_limiter: RateLimiter | None = None,
 ) -> dict:
-    """뉴스 + 옵션으로 숏폼 대본 생성."""
-    client = genai.Client(api_key=api_key)
-
-    prompt = SCRIPT_PROMPT.format(
-        tone_description=TONE_PROMPTS.get(tone, TONE_PROMPTS["유머러스"]),
-        headline=news.get("headline", ""),
-        summary=news.get("summary", ""),
-        duration=duration,
-        word_count=DURATION_WORDS.get(duration, 90),
+    """뉴스 + 옵션으로 숏폼 대본 생성.
+
+    Args:
+        use_cache: 응답 캐시 사용 여부 (None이면 MLB_LLM_CACHE 환경변수 기준)
+        refresh: True면 캐시를 무시하고 새로 생성 (결과는 캐시에 저장)
+        rate_limiter: 실제 API 호출 전마다 대기할 속도 제한 (배치 생성용)
+    """
+    prompt = SCRIPT_PROMPT.format(**script_prompt_fields(news, tone, duration))
+    script = generate_structured(
+        api_key, ScriptResponse, SCRIPT_PROMPT, prompt,
+        model=MODEL,
+        temperature=TEMPERATURE,
+        max_output_tokens=MAX_OUTPUT_TOKENS,
+        use_cache=use_cache,
+        refresh=refresh,
+        rate_limiter=rate_limiter,
     )
 
-    response = client.models.generate_content(
-        model="gemini-2.0-flash-lite",
-        contents=prompt,
-        config=types.GenerateContentConfig(
-            temperature=0.9,
-            max_output_tokens=2048,
-        ),
-    )
+    # 메타데이터 추가
+    data = script.model_dump()
+    data["_meta"] = script_meta(news, tone, duration)
+    return data
 
-    raw_text = response.text.strip()
-    # Gemini API 응답에서 ```json ... ``` 코드 블록 추출
-    json_match = re.search(r"```json\s*(.*?)\s*```", raw_text, re.DOTALL)
-    if json_match:
-        json_str = json_match.group(1)
-    else:
-        # 코드 블록이 없는 경우, 전체 텍스트를 JSON으로 간주
-        json_str = raw_text
 
-    try:
-        data = json.loads(json_str)
-    except json.JSONDecodeError:
-        # JSON 파싱 실패 시, Gemini가 생성한 텍스트를 그대로 반환하거나 에러 처리
-        raise ValueError(f"Failed to parse Gemini response as JSON. Response:\n{raw_text}")
+@dataclass
+class BatchScriptResult:
+    """배치 생성 결과 하나 (실패하면 script=None, error에 예외)."""
 
+    rank: int
+    tone: str
+    duration: int
+    news: dict
+    script: dict | None = None
+    error: Exception | None = None
 
-    # 메타데이터 추가
-    data["_meta"] = {
-        "news_headline": news.get("headline", ""),
-        "tone": tone,
-        "duration": duration,
-    }
-    return data
+
+def generate_scripts(
+    api_key: str,
+    main_news: list[dict],
+    tones: Iterable[str] = tuple(TONE_PROMPTS),
+    durations: Iterable[int] = (30,),
+    ranks: Iterable[int] | None = None,
+    max_concurrency: int = BATCH_CONCURRENCY,
+    requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+    use_cache: bool | None = None,
+    refresh: bool = False,
+) -> Iterator[BatchScriptResult]:
+    """뉴스(순위) × 말투 × 길이 조합의 대본을 동시에 생성해 끝나는 순서대로 반환.
+
+    한 조합이 실패해도 나머지는 계속 생성한다 (결과의 error 확인).
+    반복을 중간에 멈추면 아직 시작하지 않은 조합은 취소된다.
+
+    Args:
+        main_news: 오늘의 메인 뉴스 목록 (각 항목의 "rank" 사용, 없으면 1부터 순서대로)
+        tones: 말투 목록
+        durations: 길이(초) 목록
+        ranks: 생성할 뉴스 순위 (None이면 전체)
+        max_concurrency: 동시 요청 수
+        requests_per_minute: 분당 요청 한도 (0이면 제한 없음, 캐시 히트는 포함하지 않음)
+        use_cache, refresh: generate_script와 같음
+    """
+    # 뉴스마다 다시 순회하므로 제너레이터가 들어와도 한 번만 소비되도록 고정
+    tones = tuple(tones)
+    durations = tuple(durations)
+    ranks = set(ranks) if ranks is not None else None
+    jobs = [
+        (news.get("rank", i + 1), news, tone, duration)
+        for i, news in enumerate(main_news)
+        if ranks is None or news.get("rank", i + 1) in ranks
+        for tone in tones
+        for duration in durations
+    ]
+    if not jobs:
+        return
+
+    limiter = RateLimiter(requests_per_minute)
+
+    def run(rank: int, news: dict, tone: str, duration: int) -> BatchScriptResult:
+        result = BatchScriptResult(rank, tone, duration, news)
+        try:
+            result.script = generate_script(
+                api_key, news, tone, duration, use_cache, refresh, rate_limiter=limiter
+            )
+        except Exception as e:
+            result.error = e
+        return result
+
+    pool = ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(jobs))))
+    try:
+        futures = [pool.submit(run, *job) for job in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
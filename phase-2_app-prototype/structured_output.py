@@ -0,0 +1,136 @@
+"""
+Gemini 구조화 출력 (JSON 스키마 지정 + 검증)
+- 요청 시 response_schema로 출력 형식을 지정하고, 응답을 pydantic 모델로 검증
+- 형식이 조금 어긋난 응답(코드 블록, 앞뒤 설명문, 끝 쉼표)만 로컬에서 보정
+- 최대 토큰에서 잘린 응답이나 괄호가 맞지 않는 JSON은 보정하지 않고 실패로 처리 (반쯤 쓴 대본 방지)
+- 보정해도 검증에 실패하면 재시도 횟수 안에서 다시 요청 (파이프라인 전체를 다시 돌리지 않도록)
+- 검증을 통과한 응답만 응답 캐시(llm_cache)에 저장
+"""
+
+import json
+import os
+import re
+from collections.abc import Iterator
+from typing import TypeVar
+
+from google.genai import types
+from pydantic import BaseModel, ValidationError
+
+import llm_cache
+from gemini_client import RateLimiter, get_client
+
+MAX_ATTEMPTS = int(os.environ.get("MLB_LLM_MAX_ATTEMPTS", "2"))
+
+_FENCE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+Model = TypeVar("Model", bound=BaseModel)
+
+
+def _repair_candidates(text: str) -> Iterator[str]:
+    """응답 원문 → 점점 더 많이 보정한 JSON 후보 (최대 3개, 잘린 JSON은 복구하지 않음)."""
+    fenced = _FENCE.search(text)
+    if fenced:
+        text = fenced.group(1)
+    text = text.strip()
+    yield text
+
+    start = text.find("{")
+    end = text.rfind("}")
+    if 0 <= start < end:
+        body = text[start:end + 1]
+        yield body
+        yield _TRAILING_COMMA.sub(r"\1", body)
+
+
+def parse_structured(text: str, schema: type[Model]) -> Model:
+    """응답 텍스트 → 스키마 모델 (보정 후보를 차례로 시도).
+
+    Raises:
+        ValueError: 모든 후보가 JSON 파싱 또는 스키마 검증에 실패
+    """
+    error = None
+    for candidate in _repair_candidates(text):
+        try:
+            # strict=False: 문자열 안의 줄바꿈 등 제어 문자 허용
+            return schema.model_validate(json.loads(candidate, strict=False))
+        except (ValueError, ValidationError) as e:
+            error = e
+    raise ValueError(f"{schema.__name__} 형식이 아닙니다: {error}")
+
+
+def _truncated(response: types.GenerateContentResponse) -> bool:
+    """max_output_tokens에 걸려 응답이 중간에 끊겼는지 여부."""
+    candidates = response.candidates or []
+    return bool(candidates) and candidates[0].finish_reason == types.FinishReason.MAX_TOKENS
+
+
+def generate_structured(
+    api_key: str,
+    schema: type[Model],
+    template: str,
+    prompt: str,
+    *,
+    model: str,
+    temperature: float,
+    max_output_tokens: int,
+    use_cache: bool | None = None,
+    refresh: bool = False,
+    max_attempts: int = MAX_ATTEMPTS,
+    rate_limiter: RateLimiter | None = None,
+) -> Model:
+    """스키마를 지정해 Gemini 호출 → 검증된 모델.
+
+    Args:
+        schema: 응답 형식 (pydantic 모델)
+        template: 프롬프트 템플릿 (캐시 키용)
+        prompt: 완성된 프롬프트
+        use_cache: 응답 캐시 사용 여부 (None이면 MLB_LLM_CACHE 환경변수 기준)
+        refresh: True면 캐시를 무시하고 새로 생성 (결과는 캐시에 저장)
+        max_attempts: 검증 실패(잘린 응답 포함) 시 다시 요청하는 횟수 포함 최대 호출 수
+        rate_limiter: 지정하면 실제 API 호출(재시도 포함) 전마다 대기 (캐시 히트는 대기 없음)
+
+    Raises:
+        ValueError: max_attempts번 모두 검증 실패
+    """
+    cache = llm_cache.is_enabled(use_cache)
+    key = llm_cache.cache_key(
+        template, prompt, model, temperature, max_output_tokens,
+        json.dumps(schema.model_json_schema(), sort_keys=True),
+    )
+    if cache and not refresh:
+        raw_text = llm_cache.lookup(key)
+        if raw_text is not None:
+            try:
+                return parse_structured(raw_text, schema)
+            except ValueError:
+                pass
+
+    config = types.GenerateContentConfig(
+        temperature=temperature,
+        max_output_tokens=max_output_tokens,
+        response_mime_type="application/json",
+        response_schema=schema,
+    )
+    raw_text = ""
+    for _ in range(max(1, max_attempts)):
+        if rate_limiter is not None:
+            rate_limiter.wait()
+        response = get_client(api_key).models.generate_content(
+            model=model, contents=prompt, config=config
+        )
+        raw_text = (response.text or "").strip()
+        if _truncated(response):
+            continue
+        try:
+            result = parse_structured(raw_text, schema)
+        except ValueError:
+            continue
+        if cache:
+            llm_cache.store(key, raw_text)
+        return result
+
+    raise ValueError(
+        f"Failed to parse Gemini response as {schema.__name__} after {max(1, max_attempts)} attempts. "
+        f"Response:\n{raw_text}"
+    )
@@ -0,0 +1,150 @@
+"""
+배경 다운로더 벤치마크
+- 로컬 HTTP 서버(Range 지원)를 Pexels CDN 대신 띄우고 임의 데이터 파일을 내려받아 처리량 비교
+- 기준: 세션 없이 requests.get + 8KB 청크마다 write (기존 download_background 방식)
+- downloader: 단일 연결 / 구간 병렬, 그리고 연결 끊김 후 Range 이어받기
+
+Usage:
+    python benchmarks/bench_download.py --size-mb 200
+    python benchmarks/bench_download.py --size-mb 100 --drop-after-mb 30 --rate-mbps 400
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import requests
+
+import downloader
+
+
+def _make_handler(data_path: Path, drop_after: int, rate: float):
+    """Range 요청을 지원하는 정적 파일 핸들러.
+
+    drop_after > 0이면 첫 번째 전체 요청을 그 지점에서 끊는다 (이어받기 확인용).
+    rate > 0이면 연결당 전송 속도를 bytes/s로 제한한다 (네트워크 흉내).
+    """
+    size = data_path.stat().st_size
+    state = {"dropped": drop_after <= 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _range(self) -> tuple[int, int]:
+            m = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+            if not m:
+                return 0, size - 1
+            return int(m.group(1)), int(m.group(2)) if m.group(2) else size - 1
+
+        def _headers(self, start: int, end: int) -> None:
+            partial = "Range" in self.headers
+            self.send_response(206 if partial else 200)
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Content-Length", str(end - start + 1))
+            if partial:
+                self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+            self.end_headers()
+
+        def do_HEAD(self):
+            self._headers(0, size - 1)
+
+        def do_GET(self):
+            start, end = self._range()
+            self._headers(start, end)
+            with lock:
+                drop = not state["dropped"] and start == 0 and end == size - 1
+                state["dropped"] = True
+            limit = drop_after if drop else end - start + 1
+            sent = 0
+            began = time.perf_counter()
+            with open(data_path, "rb") as f:
+                f.seek(start)
+                while sent < limit:
+                    chunk = f.read(min(256 * 1024, limit - sent))
+                    if not chunk:
+                        break
+                    self.wfile.write(chunk)
+                    sent += len(chunk)
+                    if rate:
+                        ahead = sent / rate - (time.perf_counter() - began)
+                        if ahead > 0:
+                            time.sleep(ahead)
+            if drop:
+                self.close_connection = True
+
+    return Handler
+
+
+def _baseline(url: str, dest: Path) -> int:
+    """기존 방식: 세션 없이 8KB 청크마다 write."""
+    resp = requests.get(url, timeout=60, stream=True)
+    resp.raise_for_status()
+    with open(dest, "wb") as f:
+        for chunk in resp.iter_content(chunk_size=8192):
+            f.write(chunk)
+    return dest.stat().st_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="배경 다운로더 벤치마크")
+    parser.add_argument("--size-mb", type=int, default=200)
+    parser.add_argument("--rate-mbps", type=float, default=0, help="연결당 전송 제한 (Mbit/s, 0=무제한)")
+    parser.add_argument("--drop-after-mb", type=float, default=0, help="이어받기 시나리오에서 끊을 지점")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        data_path = work_dir / "source.bin"
+        with open(data_path, "wb") as f:
+            for _ in range(args.size_mb):
+                f.write(os.urandom(1024 * 1024))
+
+        rate = args.rate_mbps * 1_000_000 / 8
+        drop_after = int((args.drop_after_mb or args.size_mb / 3) * 1024 * 1024)
+
+        def serve(drop: int) -> tuple[ThreadingHTTPServer, str]:
+            server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(data_path, drop, rate))
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            return server, f"http://127.0.0.1:{server.server_port}/source.bin"
+
+        cases = [
+            ("baseline (8KB)", 0, lambda url, dest: _baseline(url, dest)),
+            ("single", 0, lambda url, dest: downloader.download(url, dest, parallel=False)),
+            ("parallel", 0, lambda url, dest: downloader.download(url, dest)),
+            ("resume", drop_after, lambda url, dest: downloader.download(url, dest, parallel=False)),
+        ]
+
+        results = []
+        for name, drop, fn in cases:
+            server, url = serve(drop)
+            dest = work_dir / f"out_{len(results)}.bin"
+            start = time.perf_counter()
+            size = fn(url, dest)
+            elapsed = time.perf_counter() - start
+            server.shutdown()
+            ok = size == data_path.stat().st_size and dest.read_bytes() == data_path.read_bytes()
+            results.append((name, elapsed, size, ok))
+            dest.unlink()
+
+    base = results[0][1]
+    limit = f"{args.rate_mbps:g} Mbit/s" if args.rate_mbps else "없음"
+    print(f"\n파일 {args.size_mb}MB, 연결당 전송 제한 {limit}")
+    for name, elapsed, size, ok in results:
+        mbps = size / elapsed / 1024 / 1024
+        print(f"  {name:<15} {elapsed:7.2f}s  {mbps:7.1f} MB/s  x{base / elapsed:.2f}  {'OK' if ok else 'MISMATCH'}")
+
+
+if __name__ == "__main__":
+    main()
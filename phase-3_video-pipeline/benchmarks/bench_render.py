@@ -0,0 +1,102 @@
+"""
+렌더링 백엔드 벤치마크
+- 합성용 입력(테스트 패턴 배경, 사인파 음성, 자막)을 생성해 백엔드별 벽시계 시간 측정
+- 기준(moviepy) 대비 속도 향상 배율 출력
+
+Usage:
+    python benchmarks/bench_render.py --duration 30 --workers 8
+    python benchmarks/bench_render.py --backends moviepy parallel ffmpeg --segment-seconds 5
+    python benchmarks/bench_render.py --backends moviepy numpy
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from moviepy.config import FFMPEG_BINARY
+
+from bg_normalizer import normalize_background
+from composer import FPS, OUTPUT_HEIGHT, OUTPUT_WIDTH, compose_video
+
+SAMPLE_PHRASES = [
+    "오늘 MLB 소식",
+    "오타니가 또 홈런을",
+    "시즌 30호 홈런입니다",
+    "다저스는 연승 행진",
+    "구독과 좋아요 부탁드려요",
+]
+
+
+def _make_inputs(work_dir: Path, duration: float) -> dict:
+    """벤치마크용 배경/음성/자막 파일 생성."""
+    bg_path = work_dir / "bg.mp4"
+    audio_path = work_dir / "audio.mp3"
+    srt_path = work_dir / "subtitle.srt"
+
+    for cmd in (
+        ["-f", "lavfi", "-i", "testsrc2=size=1280x720:rate=30:duration=10",
+         "-c:v", "libx264", "-pix_fmt", "yuv420p", str(bg_path)],
+        ["-f", "lavfi", "-i", f"sine=frequency=440:duration={duration}",
+         "-c:a", "libmp3lame", str(audio_path)],
+    ):
+        subprocess.run([FFMPEG_BINARY, "-y", "-hide_banner", "-loglevel", "error", *cmd], check=True)
+
+    lines = []
+    t, i = 0.0, 0
+    while t < duration:
+        end = min(t + 1.5, duration)
+        lines.append(f"{i + 1}\n{_srt_time(t)} --> {_srt_time(end)}\n{SAMPLE_PHRASES[i % len(SAMPLE_PHRASES)]}\n\n")
+        t, i = end, i + 1
+    srt_path.write_text("".join(lines), encoding="utf-8")
+
+    return {"audio_path": str(audio_path), "bg_path": str(bg_path), "subtitles": str(srt_path)}
+
+
+def _srt_time(seconds: float) -> str:
+    ms = int(round(seconds * 1000))
+    h, rem = divmod(ms, 3600000)
+    m, rem = divmod(rem, 60000)
+    s, ms = divmod(rem, 1000)
+    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="렌더링 백엔드 벤치마크")
+    parser.add_argument("--duration", type=float, default=30.0, help="음성 길이 (초)")
+    parser.add_argument("--backends", nargs="+", default=["moviepy", "parallel"])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--segment-seconds", type=float, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        inputs = _make_inputs(work_dir, args.duration)
+        # 배경 정규화 캐시를 미리 채워 백엔드 간 조건을 맞춤
+        normalize_background(inputs["bg_path"], OUTPUT_WIDTH, OUTPUT_HEIGHT, FPS)
+
+        timings = {}
+        for backend in args.backends:
+            start = time.perf_counter()
+            compose_video(
+                **inputs,
+                output_path=work_dir / f"out_{backend}.mp4",
+                backend=backend,
+                workers=args.workers,
+                segment_seconds=args.segment_seconds,
+            )
+            timings[backend] = time.perf_counter() - start
+
+    base = timings.get("moviepy")
+    print(f"\n음성 길이 {args.duration:.0f}초, workers={args.workers or 'auto'}")
+    for backend, elapsed in timings.items():
+        speedup = f"x{base / elapsed:.2f}" if base else "-"
+        print(f"  {backend:<10} {elapsed:8.1f}s  {speedup}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Pexels 배경 영상 로컬 캐시
+- (Pexels 영상 id, 파일 variant id)별로 한 번만 다운로드
+- 다운로드(downloader) 후 크기/SHA-256을 기록하고, 사용 전에 검증 (깨진 파일은 다시 받음)
+- 캐시 히트 시 작업 디렉토리로 하드링크 (불가능하면 복사)
+- 용량 제한 + LRU 정리 (MLB_ASSET_CACHE_MAX_MB, 기본 3GB)
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+from cache_store import cache_dir, evict_lru, file_hash, touch
+from downloader import download
+
+CACHE_NAME = "pexels_videos"
+CACHE_MAX_BYTES = int(os.environ.get("MLB_ASSET_CACHE_MAX_MB", "3072")) * 1024 * 1024
+
+
+def asset_key(video_id: int | str, variant_id: int | str) -> str:
+    """캐시 파일 이름 (확장자 제외)."""
+    return f"{video_id}_{variant_id}"
+
+
+def _paths(key: str) -> tuple[Path, Path]:
+    directory = cache_dir(CACHE_NAME)
+    return directory / f"{key}.mp4", directory / f"{key}.json"
+
+
+def _verify(video_path: Path, meta_path: Path) -> bool:
+    """기록된 크기/해시와 실제 파일이 일치하는지 확인."""
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if video_path.stat().st_size != meta["size"]:
+            return False
+        return file_hash(video_path) == meta["sha256"]
+    except (OSError, ValueError, KeyError):
+        return False
+
+
+def lookup(video_id: int | str, variant_id: int | str) -> Path | None:
+    """검증을 통과한 캐시 파일 경로 (없거나 손상됐으면 정리 후 None)."""
+    video_path, meta_path = _paths(asset_key(video_id, variant_id))
+    if not video_path.exists():
+        meta_path.unlink(missing_ok=True)
+        return None
+    if not _verify(video_path, meta_path):
+        print(f"  - 캐시 파일 검증 실패, 다시 다운로드: {video_path.name}")
+        video_path.unlink(missing_ok=True)
+        meta_path.unlink(missing_ok=True)
+        return None
+    touch(video_path)
+    return video_path
+
+
+def fetch(video_id: int | str, variant_id: int | str, url: str) -> Path:
+    """캐시에 있으면 그대로, 없으면 다운로드해 캐시에 저장한 뒤 경로 반환."""
+    cached = lookup(video_id, variant_id)
+    if cached:
+        print(f"  - 배경 캐시 히트: {cached.name}")
+        return cached
+
+    video_path, meta_path = _paths(asset_key(video_id, variant_id))
+    # 받는 중에는 <key>.mp4.part (끊기면 다음 실행에서 이어받음), 완료 시 교체
+    size = download(url, video_path)
+
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump({"url": url, "size": size, "sha256": file_hash(video_path)}, f)
+
+    if evict_lru(video_path.parent, CACHE_MAX_BYTES, "*.mp4"):
+        for stale in video_path.parent.glob("*.json"):
+            if not stale.with_suffix(".mp4").exists():
+                stale.unlink(missing_ok=True)
+    return video_path
+
+
+def materialize(cached_path: Path, dest: str | Path) -> str:
+    """캐시 파일을 작업 디렉토리 경로로 하드링크 (다른 볼륨이면 복사)."""
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    dest.unlink(missing_ok=True)
+    try:
+        os.link(cached_path, dest)
+    except OSError:
+        shutil.copyfile(cached_path, dest)
+    return str(dest)
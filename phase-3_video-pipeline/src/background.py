@@ -3,12 +3,19 @@ Pexels API 배경 영상 다운로드 모듈
 - 무료 API, CC 라이선스
 - 야구/스포츠 관련 영상 검색
 - 세로 영상(9:16) 우선 검색
+- 다운로드한 영상은 로컬 캐시(asset_cache)에서 재사용
+- 검색 결과는 TTL 동안 로컬 캐시, 키워드별 후보 순번을 저장해 실행마다 다른 영상 선택
 """
 
+import json
 import os
-import requests
+import time
 from pathlib import Path
 
+import asset_cache
+from cache_store import cache_dir, content_hash
+from downloader import get_session
+
 PEXELS_API_URL = "https://api.pexels.com/videos/search"
 
 SEARCH_QUERIES = [
@@ -19,70 +26,160 @@ SEARCH_QUERIES = [
     "baseball field",
 ]
 
+# 파일 선택 기준 (최종 출력 규격)
+TARGET_WIDTH = 1080
+TARGET_HEIGHT = 1920
+TARGET_FPS = 30
 
-def search_videos(api_key: str, query: str, per_page: int = 5) -> list[dict]:
-    """Pexels에서 영상 검색."""
-    headers = {"Authorization": api_key}
+SEARCH_CACHE_NAME = "pexels_search"
+SEARCH_CACHE_TTL = float(os.environ.get("MLB_PEXELS_SEARCH_TTL_HOURS", "24")) * 3600
+ROTATION_FILE = "rotation.json"
+
+
+def _write_json(path: Path, data) -> None:
+    """임시 파일에 쓰고 교체 (동시 실행 중 반쯤 쓰인 파일을 읽지 않도록)."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def search_videos(
+    api_key: str, query: str, per_page: int = 15, use_cache: bool = True
+) -> list[dict]:
+    """Pexels에서 영상 검색 (같은 조건은 SEARCH_CACHE_TTL 동안 로컬 캐시 재사용).
+
+    Args:
+        use_cache: False면 캐시를 무시하고 API 호출 (결과는 캐시에 저장)
+    """
     params = {
         "query": query,
         "per_page": per_page,
         "orientation": "portrait",
         "size": "medium",
     }
-    resp = requests.get(PEXELS_API_URL, headers=headers, params=params, timeout=15)
+    cache_path = cache_dir(SEARCH_CACHE_NAME) / f"{content_hash(sorted(params.items()))[:24]}.json"
+
+    if use_cache and cache_path.exists():
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if time.time() - cached["fetched_at"] < SEARCH_CACHE_TTL:
+                return cached["videos"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    headers = {"Authorization": api_key}
+    resp = get_session().get(PEXELS_API_URL, headers=headers, params=params, timeout=15)
     resp.raise_for_status()
-    return resp.json().get("videos", [])
-
-
-def _pick_best_file(video: dict) -> str | None:
-    """영상에서 적절한 해상도의 다운로드 URL 선택."""
-    files = video.get("video_files", [])
-    # HD 세로 영상 우선
-    for f in files:
-        w, h = f.get("width", 0), f.get("height", 0)
-        if h >= 1080 and w < h:
-            return f["link"]
-    # HD 가로 영상
-    for f in files:
-        w, h = f.get("width", 0), f.get("height", 0)
-        if h >= 720:
-            return f["link"]
-    # 아무거나
-    if files:
-        return files[0]["link"]
-    return None
+    videos = resp.json().get("videos", [])
+    _write_json(cache_path, {"query": query, "fetched_at": time.time(), "videos": videos})
+    return videos
 
 
-def download_background(api_key: str, output_dir: str | Path, query: str | None = None) -> str:
-    """배경 영상 검색 및 다운로드.
+def _load_rotation() -> dict[str, int]:
+    """키워드별 다음 후보 순번."""
+    try:
+        with open(cache_dir(SEARCH_CACHE_NAME) / ROTATION_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_rotation(query: str, next_index: int) -> None:
+    rotation = _load_rotation()
+    rotation[query] = next_index
+    _write_json(cache_dir(SEARCH_CACHE_NAME) / ROTATION_FILE, rotation)
+
+
+def score_video_file(
+    file: dict,
+    duration: float = 0,
+    width: int = TARGET_WIDTH,
+    height: int = TARGET_HEIGHT,
+    fps: float = TARGET_FPS,
+) -> tuple[int, float]:
+    """Pexels video_files 항목 점수 (작을수록 좋음).
+
+    Returns:
+        (등급, 비용)
+        등급 0: 출력 크기를 확대 없이 덮고 fps도 충분 → 비용 = 예상 다운로드 바이트
+        등급 1: 해상도는 충분하지만 fps 부족 → 비용 = 예상 다운로드 바이트
+        등급 2: 확대가 필요 → 비용 = -확대 후 비율 (덜 확대할수록 좋음)
+        등급 3: mp4가 아니거나 크기 정보 없음
+    """
+    w, h = file.get("width") or 0, file.get("height") or 0
+    if not w or not h or file.get("file_type", "video/mp4") != "video/mp4":
+        return 3, 0.0
+
+    # 9:16으로 채우는 스케일 (1 이하면 축소만, 남는 부분은 크롭)
+    scale = max(width / w, height / h)
+    if scale > 1.0:
+        return 2, -1.0 / scale
+
+    file_fps = file.get("fps") or fps
+    # 용량 정보가 없으면 픽셀 수 × fps × 길이로 추정 (H.264 약 0.1 bit/pixel)
+    expected = file.get("size") or w * h * file_fps * max(duration, 1.0) * 0.1 / 8
+    tier = 0 if file_fps >= fps * 0.95 else 1
+    return tier, float(expected)
+
+
+def _pick_best_file(video: dict) -> dict | None:
+    """출력 해상도를 확대 없이 덮는 가장 작은(다운로드/디코딩이 가장 적은) 파일 항목."""
+    files = [f for f in video.get("video_files", []) if f.get("link")]
+    if not files:
+        return None
+    duration = video.get("duration") or 0
+    return min(files, key=lambda f: score_video_file(f, duration))
+
+
+def fetch_background(api_key: str, query: str | None = None) -> Path:
+    """배경 영상 검색 후 로컬 캐시 경로 반환 (캐시에 없으면 다운로드).
+
+    검색 결과 후보는 키워드별 저장된 순번부터 차례로 시도해 호출마다 다른 영상을 고른다.
 
     Args:
         api_key: Pexels API key
-        output_dir: 저장 디렉토리
         query: 검색 키워드 (None이면 기본 키워드 순회)
 
     Returns:
-        다운로드된 영상 파일 경로
+        asset_cache 안의 영상 파일 경로
     """
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    bg_path = output_dir / "background.mp4"
-
     queries = [query] if query else SEARCH_QUERIES
 
+    rotation = _load_rotation()
     for q in queries:
         try:
             videos = search_videos(api_key, q)
-            for video in videos:
-                url = _pick_best_file(video)
-                if url:
-                    resp = requests.get(url, timeout=60, stream=True)
-                    resp.raise_for_status()
-                    with open(bg_path, "wb") as f:
-                        for chunk in resp.iter_content(chunk_size=8192):
-                            f.write(chunk)
-                    return str(bg_path)
+            start = rotation.get(q, 0) % len(videos) if videos else 0
+            for offset in range(len(videos)):
+                index = (start + offset) % len(videos)
+                video = videos[index]
+                file = _pick_best_file(video)
+                if file:
+                    variant_id = file.get("id") or content_hash(file["link"])[:16]
+                    cached = asset_cache.fetch(video["id"], variant_id, file["link"])
+                    _save_rotation(q, index + 1)
+                    return cached
         except Exception:
             continue
 
     raise RuntimeError("배경 영상을 다운로드할 수 없습니다. Pexels API 키를 확인하세요.")
+
+
+def download_background(api_key: str, output_dir: str | Path, query: str | None = None) -> str:
+    """배경 영상 검색 및 다운로드.
+
+    같은 Pexels 영상/파일은 로컬 캐시에서 링크(또는 복사)만 하고 다시 받지 않는다.
+
+    Args:
+        api_key: Pexels API key
+        output_dir: 저장 디렉토리
+        query: 검색 키워드 (None이면 기본 키워드 순회)
+
+    Returns:
+        다운로드된 영상 파일 경로
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return asset_cache.materialize(fetch_background(api_key, query), output_dir / "background.mp4")
@@ -0,0 +1,102 @@
+"""
+배경 영상 정규화 캐시
+- 원본(Pexels 등) 영상을 한 번만 출력 규격(1080x1920@30fps)으로 트랜스코딩
+- 원본 파일 내용 해시로 저장 → 같은 클립은 다음 렌더링부터 스케일/크롭 없이 재사용
+- 고정 GOP(키프레임 간격)로 인코딩해 루프/구간 탐색 비용 최소화
+"""
+
+import os
+import subprocess
+from pathlib import Path
+
+from moviepy.config import FFMPEG_BINARY
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+from cache_store import cache_dir, content_hash, evict_lru, file_hash, touch
+
+NORMALIZE_VERSION = 1
+CACHE_NAME = "backgrounds"
+CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+GOP_SECONDS = 2
+NORMALIZE_PRESET = "veryfast"
+NORMALIZE_CRF = 18
+STILL_IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".webp")
+
+
+def normalized_key(bg_path: str | Path, width: int, height: int, fps: int) -> str:
+    """정규화 결과 캐시 키 (원본 내용 + 출력 규격)."""
+    return content_hash(NORMALIZE_VERSION, file_hash(bg_path), width, height, fps)
+
+
+def normalized_path(bg_path: str | Path, width: int, height: int, fps: int) -> Path:
+    """정규화 결과가 저장될 캐시 경로 (존재 여부와 무관)."""
+    return cache_dir(CACHE_NAME) / f"{normalized_key(bg_path, width, height, fps)}.mp4"
+
+
+def is_still_image(bg_path: str | Path) -> bool:
+    """정지 이미지 배경(단색 대체 배경 등)인지 여부 - 디코딩/정규화 불필요."""
+    return Path(bg_path).suffix.lower() in STILL_IMAGE_SUFFIXES
+
+
+def is_normalized(
+    bg_path: str | Path, width: int | None = None, height: int | None = None, fps: int | None = None
+) -> bool:
+    """이미 정규화 캐시에 있는 파일인지 여부 (규격을 주면 해상도/fps까지 일치해야 함)."""
+    if Path(bg_path).resolve().parent != cache_dir(CACHE_NAME).resolve():
+        return False
+    if width is None:
+        return True
+    infos = ffmpeg_parse_infos(str(bg_path))
+    return (
+        list(infos.get("video_size") or []) == [width, height]
+        and round(infos.get("video_fps") or 0) == fps
+    )
+
+
+def normalize_background(bg_path: str | Path, width: int, height: int, fps: int) -> str:
+    """배경 영상을 출력 규격으로 정규화 (캐시 히트 시 트랜스코딩 생략).
+
+    Args:
+        bg_path: 원본 배경 영상 경로
+        width, height: 출력 해상도 (가운데 기준 크롭)
+        fps: 출력 프레임레이트
+
+    Returns:
+        정규화된 영상 경로 (오디오 트랙 없음, 정지 이미지는 그대로 반환)
+    """
+    if is_still_image(bg_path):
+        return str(bg_path)
+    if is_normalized(bg_path, width, height, fps):
+        touch(bg_path)
+        return str(bg_path)
+
+    out_path = normalized_path(bg_path, width, height, fps)
+    out_dir = out_path.parent
+    if out_path.exists():
+        touch(out_path)
+        return str(out_path)
+
+    tmp_path = out_path.with_suffix(f".{os.getpid()}.tmp")
+    gop = fps * GOP_SECONDS
+    cmd = [
+        FFMPEG_BINARY, "-y", "-hide_banner", "-loglevel", "error",
+        "-i", str(bg_path),
+        "-an",
+        "-vf", (
+            f"scale={width}:{height}:force_original_aspect_ratio=increase,"
+            f"crop={width}:{height},setsar=1,fps={fps}"
+        ),
+        "-c:v", "libx264", "-preset", NORMALIZE_PRESET, "-crf", str(NORMALIZE_CRF),
+        "-pix_fmt", "yuv420p",
+        "-g", str(gop), "-keyint_min", str(gop), "-sc_threshold", "0",
+        "-movflags", "+faststart",
+        "-f", "mp4", str(tmp_path),
+    ]
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        tmp_path.unlink(missing_ok=True)
+        raise RuntimeError(f"배경 정규화 실패:\n{proc.stderr.strip()}")
+
+    tmp_path.replace(out_path)
+    evict_lru(out_dir, CACHE_MAX_BYTES, "*.mp4")
+    return str(out_path)
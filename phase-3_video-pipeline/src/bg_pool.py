@@ -0,0 +1,152 @@
+"""
+배경 영상 예열 풀
+- 아침 실행(07:00 KST 뉴스 수집) 전에 배경 N개를 미리 다운로드 + 정규화해 로컬에 보관
+- run_pipeline은 풀에서 하나를 즉시 꺼내 쓰고 (비어 있으면 기존 다운로드 경로), 다운로드가
+  아침 실행의 임계 경로에서 빠짐
+- 채우기는 한가한 시간에 명령으로 실행 (cron / 작업 스케줄러)
+
+Usage:
+    python src/bg_pool.py --size 6
+    python src/bg_pool.py --status
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+from asset_cache import materialize
+from bg_normalizer import normalize_background, normalized_path
+from cache_store import cache_dir, file_hash, remember_file_hash
+
+POOL_NAME = "bg_pool"
+DEFAULT_POOL_SIZE = int(os.environ.get("MLB_BG_POOL_SIZE", "5"))
+# 예열 대상 규격 (최종 출력)
+POOL_WIDTH = 1080
+POOL_HEIGHT = 1920
+POOL_FPS = 30
+
+
+def _pool_dir() -> Path:
+    return cache_dir(POOL_NAME)
+
+
+def _entries(query: str | None = None) -> list[tuple[Path, dict]]:
+    """풀 항목 (오래된 것부터). query가 같은 항목만."""
+    entries = []
+    for meta_path in _pool_dir().glob("*.json"):
+        video_path = meta_path.with_suffix(".mp4")
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            mtime = video_path.stat().st_mtime
+        except (OSError, ValueError):
+            continue
+        if meta.get("query") == query:
+            entries.append((mtime, video_path, meta))
+    return [(path, meta) for _, path, meta in sorted(entries, key=lambda e: e[0])]
+
+
+def pool_size(query: str | None = None) -> int:
+    """사용 가능한 풀 항목 수."""
+    return len(_entries(query))
+
+
+def take_background(
+    output_dir: str | Path, query: str | None = None, filename: str = "background.mp4"
+) -> str | None:
+    """풀에서 배경 하나를 꺼내 output_dir/filename으로 옮김 (다운로드 대기 없음).
+
+    여러 프로세스가 동시에 꺼내도 같은 항목을 받지 않도록 풀 안에서 이름을 바꿔 선점한다.
+    풀에는 원본이 있고 정규화본은 공용 정규화 캐시에 있으므로, 그 사이 LRU 정리로
+    정규화본이 지워졌으면 여기서 다시 정규화한다 (평소에는 캐시 조회만).
+
+    Returns:
+        배경 파일 경로 (풀이 비었으면 None)
+    """
+    for video_path, meta in _entries(query):
+        claimed = video_path.with_name(f"{video_path.stem}.{os.getpid()}.taken")
+        try:
+            os.replace(video_path, claimed)
+        except OSError:
+            continue  # 다른 프로세스가 먼저 가져감
+        try:
+            dest = materialize(claimed, Path(output_dir) / filename)
+        finally:
+            claimed.unlink(missing_ok=True)
+            video_path.with_suffix(".json").unlink(missing_ok=True)
+        # 원본 해시를 알려 줘서 정규화 캐시 조회 때 파일을 다시 읽지 않게 함
+        remember_file_hash(dest, meta["sha256"])
+        if not normalized_path(dest, POOL_WIDTH, POOL_HEIGHT, POOL_FPS).exists():
+            print("  - 풀 배경의 정규화본이 캐시에서 정리됨, 다시 정규화")
+        try:
+            normalize_background(dest, POOL_WIDTH, POOL_HEIGHT, POOL_FPS)
+        except RuntimeError as e:
+            print(f"  - 풀 배경 정규화 실패 (렌더링 시 다시 시도): {e}")
+        return dest
+    return None
+
+
+def refill_pool(
+    api_key: str,
+    size: int = DEFAULT_POOL_SIZE,
+    query: str | None = None,
+) -> int:
+    """풀이 size개가 될 때까지 배경을 다운로드 + 정규화해 추가.
+
+    Returns:
+        새로 추가한 항목 수
+    """
+    from background import fetch_background
+
+    pool_dir = _pool_dir()
+    added = 0
+    # 검색 후보 순환이 한 바퀴 돌아 같은 영상만 나오면 멈추도록 시도 횟수 제한
+    for _ in range(max(0, size - pool_size(query)) * 3):
+        if pool_size(query) >= size:
+            break
+        source = fetch_background(api_key, query)
+        digest = file_hash(source)
+        video_path = pool_dir / f"{digest[:24]}.mp4"
+        if video_path.exists():
+            continue
+        normalize_background(source, POOL_WIDTH, POOL_HEIGHT, POOL_FPS)
+
+        tmp_path = video_path.with_name(f"{video_path.stem}.{os.getpid()}.tmp")
+        materialize(source, tmp_path)
+        with open(video_path.with_suffix(".json"), "w", encoding="utf-8") as f:
+            json.dump({"query": query, "source": source.name, "sha256": digest}, f)
+        os.replace(tmp_path, video_path)
+        added += 1
+        print(f"  - 풀 추가: {source.name}")
+    return added
+
+
+def main():
+    from dotenv import load_dotenv
+
+    load_dotenv(Path(__file__).resolve().parent.parent / ".env")
+
+    parser = argparse.ArgumentParser(description="배경 영상 예열 풀 채우기")
+    parser.add_argument("--size", type=int, default=DEFAULT_POOL_SIZE, help="유지할 배경 수")
+    parser.add_argument("--query", type=str, default=None, help="검색 키워드 (기본: 기본 키워드 순회)")
+    parser.add_argument("--pexels-key", type=str, default=None)
+    parser.add_argument("--status", action="store_true", help="현재 풀 크기만 출력")
+    args = parser.parse_args()
+
+    if args.status:
+        print(f"배경 풀: {pool_size(args.query)}개")
+        return
+
+    api_key = args.pexels_key or os.environ.get("PEXELS_API_KEY", "")
+    if not api_key:
+        print("PEXELS_API_KEY가 필요합니다.")
+        sys.exit(1)
+
+    added = refill_pool(api_key, args.size, args.query)
+    print(f"배경 풀: {pool_size(args.query)}개 (추가 {added}개)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+로컬 캐시 공통 유틸
+- 캐시 루트 경로 (MLB_CACHE_DIR 환경변수로 변경 가능)
+- 콘텐츠 해시 기반 캐시 키
+- 디렉토리 단위 용량 제한 + LRU 정리 (mtime = 마지막 사용 시각)
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+CACHE_ROOT = Path(
+    os.environ.get("MLB_CACHE_DIR") or Path(__file__).resolve().parent.parent / "cache"
+)
+
+_file_hash_memo: dict[tuple, str] = {}
+
+
+def cache_dir(name: str) -> Path:
+    """캐시 하위 디렉토리 (없으면 생성)."""
+    path = CACHE_ROOT / name
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def content_hash(*parts) -> str:
+    """캐시 키 생성 (입력값 순서까지 반영한 SHA-256)."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(repr(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def file_hash(path: str | Path, chunk_size: int = 1024 * 1024) -> str:
+    """파일 내용 SHA-256 (같은 프로세스에서는 크기/수정시각이 같으면 재사용)."""
+    path = Path(path)
+    st = path.stat()
+    memo_key = (str(path.resolve()), st.st_size, st.st_mtime_ns)
+    digest = _file_hash_memo.get(memo_key)
+    if digest is None:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                h.update(chunk)
+        digest = h.hexdigest()
+        _file_hash_memo[memo_key] = digest
+    return digest
+
+
+def remember_file_hash(path: str | Path, digest: str) -> None:
+    """이미 알고 있는 파일 해시를 등록 (링크/이동한 파일을 다시 읽지 않도록)."""
+    path = Path(path)
+    st = path.stat()
+    _file_hash_memo[(str(path.resolve()), st.st_size, st.st_mtime_ns)] = digest
+
+
+def touch(path: str | Path) -> None:
+    """캐시 항목 사용 시각 갱신 (LRU 기준)."""
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass
+
+
+def evict_lru(directory: str | Path, max_bytes: int, pattern: str = "*") -> int:
+    """용량 초과 시 오래 사용하지 않은 파일부터 삭제.
+
+    Returns:
+        삭제한 파일 수
+    """
+    files = []
+    for f in Path(directory).glob(pattern):
+        try:
+            st = f.stat()
+        except OSError:
+            continue
+        if f.is_file():
+            files.append((st.st_mtime, st.st_size, f))
+
+    total = sum(size for _, size, _ in files)
+    removed = 0
+    for _, size, f in sorted(files):
+        if total <= max_bytes:
+            break
+        try:
+            f.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
@@ -4,194 +4,340 @@ MoviePy 영상 합성 모듈
 - 최종 출력: 1080x1920 세로 영상 (9:16)
 """
 
+from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
 from moviepy import (
     AudioFileClip,
-    ColorClip,
-    CompositeVideoClip,
-    ImageClip,
-    TextClip,
+    VideoClip,
     VideoFileClip,
-    concatenate_videoclips,
+    vfx,
 )
 
-from subtitle import parse_srt, group_subtitles
+from PIL import Image, ImageOps
+
+from bg_normalizer import is_still_image, normalize_background
+from fonts import resolve_font_path
+from overlay_layers import OverlayLayer, OverlayTimeline, darken_lut, restore_regions
+from subtitle import WordTimings, group_subtitles, load_subtitles
+from text_sprite import render_text_sprite
 
 OUTPUT_WIDTH = 1080
 OUTPUT_HEIGHT = 1920
 FPS = 30
 
+# 레이어 공통 설정 (MoviePy / ffmpeg 렌더러 공유)
+DARK_OVERLAY_OPACITY = 0.3
+SUBTITLE_FONT_SIZE = 52
+SUBTITLE_STROKE_WIDTH = 3
+SUBTITLE_MAX_CHARS = 15
+SUBTITLE_MARGIN_X = 50
+SUBTITLE_Y = OUTPUT_HEIGHT - 350
+STAT_CARD_WIDTH = OUTPUT_WIDTH - 100
+STAT_CARD_Y = OUTPUT_HEIGHT // 2 - 200
+STAT_CARD_DURATION = 3.0
+
+RENDER_BACKENDS = ("moviepy", "ffmpeg", "parallel", "numpy")
+
+
+@dataclass(frozen=True)
+class RenderProfile:
+    """출력 해상도/프레임레이트/인코딩 설정.
+
+    레이아웃 상수는 1080x1920 기준이며, px()로 프로필 해상도에 맞춰 환산.
+    """
+    width: int
+    height: int
+    fps: int
+    preset: str
+
+    @property
+    def scale(self) -> float:
+        return self.width / OUTPUT_WIDTH
+
+    def px(self, value: float) -> int:
+        """1080x1920 기준 픽셀 값 → 프로필 해상도 픽셀 값."""
+        return int(round(value * self.scale))
+
 
-def _get_font_path() -> str:
-    """자막용 한국어 폰트 경로."""
-    candidates = [
-        "C:/Windows/Fonts/malgun.ttf",
-        "C:/Windows/Fonts/NanumGothicBold.ttf",
-        "C:/Windows/Fonts/gulim.ttc",
-    ]
-    for p in candidates:
-        if Path(p).exists():
-            return p
-    return "C:/Windows/Fonts/arial.ttf"
+FINAL_PROFILE = RenderProfile(OUTPUT_WIDTH, OUTPUT_HEIGHT, FPS, "medium")
+# 편집자 확인용 초안: 1/4 픽셀 수, 절반 프레임, 최고속 프리셋
+DRAFT_PROFILE = RenderProfile(OUTPUT_WIDTH // 2, OUTPUT_HEIGHT // 2, FPS // 2, "ultrafast")
+RENDER_PROFILES = {"final": FINAL_PROFILE, "draft": DRAFT_PROFILE}
 
 
-def _prepare_background(bg_path: str, duration: float) -> VideoFileClip:
-    """배경 영상을 9:16 비율로 리사이즈/크롭하고 길이 맞춤."""
-    clip = VideoFileClip(bg_path)
+def _get_font_path() -> str | None:
+    """자막용 한국어 폰트 경로 (폰트 레지스트리에서 프로세스당 한 번 탐색)."""
+    return resolve_font_path()
+
+
+def _prepare_background(
+    bg_path: str, duration: float, profile: RenderProfile = FINAL_PROFILE
+) -> VideoFileClip:
+    """배경 영상을 9:16 규격으로 정규화하고 길이 맞춤.
+
+    정규화 결과는 원본 해시로 캐시되므로, 같은 클립은 프레임 단위
+    리사이즈/크롭 없이 정규화 파일을 그대로 루프 재생한다.
+    """
+    try:
+        clip = VideoFileClip(
+            normalize_background(bg_path, profile.width, profile.height, profile.fps)
+        )
+    except RuntimeError as e:
+        print(f"  - 배경 정규화 실패, 프레임 단위 리사이즈 사용: {e}")
+        clip = _fit_to_frame(VideoFileClip(bg_path), profile.width, profile.height)
 
     # 영상 길이가 짧으면 반복
     if clip.duration < duration:
-        repeats = int(duration / clip.duration) + 1
-        clip = concatenate_videoclips([clip] * repeats)
-    clip = clip.subclipped(0, duration)
+        clip = clip.with_effects([vfx.Loop(duration=duration)])
+    return clip.subclipped(0, duration)
+
+
+def _prepare_still_base(bg_path: str, profile: RenderProfile = FINAL_PROFILE) -> np.ndarray:
+    """정지 이미지 배경 → 출력 크기로 맞추고 어두운 오버레이를 미리 적용한 RGB 프레임.
+
+    프레임마다 디코딩/오버레이 합성을 하지 않도록 한 번만 계산한다.
+    """
+    with Image.open(bg_path) as img:
+        fitted = ImageOps.fit(img.convert("RGB"), (profile.width, profile.height))
+    base = np.asarray(fitted, dtype=np.float32) * (1.0 - DARK_OVERLAY_OPACITY)
+    return base.round().astype(np.uint8)
 
+
+def _fit_to_frame(clip: VideoFileClip, out_w: int, out_h: int) -> VideoFileClip:
+    """원본 클립을 9:16 비율로 리사이즈/크롭 (정규화 실패 시 대체 경로)."""
     # 리사이즈: 세로 기준 맞춤
     w, h = clip.size
-    target_ratio = OUTPUT_WIDTH / OUTPUT_HEIGHT  # 0.5625
+    target_ratio = out_w / out_h  # 0.5625
 
     if w / h > target_ratio:
         # 가로가 넓으면 → 세로 기준 리사이즈 후 가로 크롭
-        new_h = OUTPUT_HEIGHT
-        new_w = int(w * (OUTPUT_HEIGHT / h))
+        new_h = out_h
+        new_w = int(w * (out_h / h))
         clip = clip.resized((new_w, new_h))
         x_center = new_w // 2
         clip = clip.cropped(
-            x1=x_center - OUTPUT_WIDTH // 2,
+            x1=x_center - out_w // 2,
             y1=0,
-            x2=x_center + OUTPUT_WIDTH // 2,
-            y2=OUTPUT_HEIGHT,
+            x2=x_center + out_w // 2,
+            y2=out_h,
         )
     else:
         # 세로가 길거나 같으면 → 가로 기준 리사이즈 후 세로 크롭
-        new_w = OUTPUT_WIDTH
-        new_h = int(h * (OUTPUT_WIDTH / w))
+        new_w = out_w
+        new_h = int(h * (out_w / w))
         clip = clip.resized((new_w, new_h))
         y_center = new_h // 2
         clip = clip.cropped(
             x1=0,
-            y1=y_center - OUTPUT_HEIGHT // 2,
-            x2=OUTPUT_WIDTH,
-            y2=y_center + OUTPUT_HEIGHT // 2,
+            y1=y_center - out_h // 2,
+            x2=out_w,
+            y2=y_center + out_h // 2,
         )
 
     return clip
 
 
-def _create_subtitle_clips(srt_path: str, font_path: str) -> list:
-    """SRT 자막 → TextClip 리스트."""
-    entries = parse_srt(srt_path)
-    grouped = group_subtitles(entries, max_chars=15)
-
-    clips = []
-    for entry in grouped:
-        duration = entry["end"] - entry["start"]
-        if duration <= 0:
-            continue
-
-        txt_clip = (
-            TextClip(
-                text=entry["text"],
-                font=font_path,
-                font_size=52,
-                color="white",
-                stroke_color="black",
-                stroke_width=3,
-                text_align="center",
-                size=(OUTPUT_WIDTH - 100, None),
-                method="caption",
-            )
-            .with_position(("center", OUTPUT_HEIGHT - 350))
-            .with_start(entry["start"])
-            .with_duration(duration)
+def _load_subtitle_groups(subtitles: WordTimings | str) -> list[dict]:
+    """단어 타이밍(또는 SRT 파일) → 화면 표시 단위로 묶은 자막 리스트."""
+    return group_subtitles(load_subtitles(subtitles), max_chars=SUBTITLE_MAX_CHARS)
+
+
+def _stat_card_start(audio_duration: float) -> float:
+    """스탯 카드 표시 시작 시각 (영상 40% 지점, 최소 3초)."""
+    return max(audio_duration * 0.4, 3.0)
+
+
+def _build_overlay_layers(
+    subtitles: WordTimings | str,
+    stat_card_path: str | None,
+    total_duration: float,
+    profile: RenderProfile = FINAL_PROFILE,
+) -> list[OverlayLayer]:
+    """자막 스프라이트 + 스탯 카드(영상 중반 3초) → 오버레이 레이어 리스트."""
+    w, h = profile.width, profile.height
+    font_path = _get_font_path()
+    layers = []
+
+    for entry in _load_subtitle_groups(subtitles):
+        sprite = render_text_sprite(
+            entry["text"],
+            font_path,
+            font_size=profile.px(SUBTITLE_FONT_SIZE),
+            stroke_width=max(1, profile.px(SUBTITLE_STROKE_WIDTH)),
+            max_width=profile.px(OUTPUT_WIDTH - 2 * SUBTITLE_MARGIN_X),
+        )
+        layer = OverlayLayer.from_rgba(
+            sprite, (w - sprite.shape[1]) // 2, profile.px(SUBTITLE_Y),
+            entry["start"], entry["end"], w, h,
+        )
+        if layer:
+            layers.append(layer)
+
+    if stat_card_path and Path(stat_card_path).exists():
+        with Image.open(stat_card_path) as img:
+            card = img.convert("RGBA")
+        card_w = profile.px(STAT_CARD_WIDTH)
+        card_h = round(card.height * card_w / card.width)
+        card = np.asarray(card.resize((card_w, card_h), Image.LANCZOS))
+        show_at = _stat_card_start(total_duration)
+        layer = OverlayLayer.from_rgba(
+            card, (w - card_w) // 2, profile.px(STAT_CARD_Y),
+            show_at, show_at + STAT_CARD_DURATION, w, h,
         )
-        clips.append(txt_clip)
+        if layer:
+            layers.append(layer)
+
+    return layers
+
+
+class LayeredVideoClip(VideoClip):
+    """배경 위에 오버레이 레이어를 바운딩 박스 영역만 블렌딩하는 합성 클립.
 
-    return clips
+    CompositeVideoClip은 레이어마다 전체 프레임 크기 RGBA 캔버스를 만들어
+    alpha_composite 하므로, 자막 띠/스탯 카드 영역만 갱신하도록 대체한다.
+    - 영상 배경: 디코딩 프레임 → 어두운 오버레이 LUT → 활성 레이어 영역 블렌딩
+    - 정지 배경: 활성 레이어가 없으면 미리 계산한 배경 그대로 반환,
+      있으면 직전 프레임에서 덮어쓴 영역만 복원 후 블렌딩
+    """
 
+    def __init__(
+        self,
+        timeline: OverlayTimeline,
+        duration: float,
+        profile: RenderProfile,
+        bg_clip: VideoFileClip | None = None,
+        still_base: np.ndarray | None = None,
+    ):
+        self.timeline = timeline
+        self.bg_clip = bg_clip
+        self.still_base = still_base
+        self._canvas = np.empty((profile.height, profile.width, 3), dtype=np.uint8)
+        self._dirty: list | None = None  # 정지 배경 캔버스에 남은 레이어 영역 (None이면 미초기화)
+        self._dark_lut = darken_lut(DARK_OVERLAY_OPACITY)
+        super().__init__(frame_function=self._render_frame, duration=duration)
+
+    def _render_frame(self, t: float) -> np.ndarray:
+        layers = self.timeline.active_at(t)
+        canvas = self._canvas
+
+        if self.still_base is not None:
+            if not layers:
+                return self.still_base
+            if self._dirty is None:
+                np.copyto(canvas, self.still_base)
+            else:
+                restore_regions(canvas, self.still_base, self._dirty)
+            self._dirty = [layer.bbox for layer in layers]
+        else:
+            np.take(self._dark_lut, self.bg_clip.get_frame(t), out=canvas, mode="clip")
+
+        self.timeline.blend(canvas, layers)
+        return canvas
+
+
+def build_composite(
+    bg_path: str,
+    subtitles: WordTimings | str,
+    stat_card_path: str | None,
+    total_duration: float,
+    profile: RenderProfile = FINAL_PROFILE,
+) -> tuple[LayeredVideoClip, VideoFileClip | None]:
+    """배경/오버레이/자막/스탯 카드 레이어를 합성한 클립 (오디오 제외).
 
-def _create_stat_overlay(stat_card_path: str, audio_duration: float) -> ImageClip | None:
-    """스탯 카드 오버레이 (영상 중반에 3초간 표시)."""
-    if not stat_card_path or not Path(stat_card_path).exists():
-        return None
+    정지 이미지 배경이면 오버레이를 미리 적용한 단일 이미지를 바탕으로
+    자막/스탯 카드만 시간 구간별로 얹는다 (영상 디코딩 없음).
 
-    show_at = max(audio_duration * 0.4, 3.0)  # 영상 40% 지점
-    card = (
-        ImageClip(stat_card_path)
-        .resized(width=OUTPUT_WIDTH - 100)
-        .with_position(("center", OUTPUT_HEIGHT // 2 - 200))
-        .with_start(show_at)
-        .with_duration(3.0)
+    Returns:
+        (합성 클립, 배경 클립) - 배경 클립은 렌더링 후 close 필요 (정지 배경이면 None)
+    """
+    timeline = OverlayTimeline(
+        _build_overlay_layers(subtitles, stat_card_path, total_duration, profile)
     )
-    return card
+
+    if is_still_image(bg_path):
+        final = LayeredVideoClip(
+            timeline, total_duration, profile, still_base=_prepare_still_base(bg_path, profile)
+        )
+        return final, None
+
+    bg_clip = _prepare_background(bg_path, total_duration, profile)
+    return LayeredVideoClip(timeline, total_duration, profile, bg_clip=bg_clip), bg_clip
 
 
 def compose_video(
     audio_path: str,
     bg_path: str,
-    srt_path: str,
+    subtitles: WordTimings | str,
     output_path: str | Path,
     stat_card_path: str | None = None,
+    backend: str = "moviepy",
+    workers: int | None = None,
+    segment_seconds: float | None = None,
+    quality: str = "final",
 ) -> str:
     """모든 요소를 합성하여 최종 영상 생성.
 
     Args:
         audio_path: TTS 음성 파일 경로
         bg_path: 배경 영상 파일 경로
-        srt_path: SRT 자막 파일 경로
+        subtitles: TTS 단어 타이밍 (WordTimings) 또는 SRT 자막 파일 경로
         output_path: 최종 영상 출력 경로
         stat_card_path: 스탯 카드 이미지 경로 (optional)
+        backend: "moviepy" (기준 렌더러), "ffmpeg" (필터그래프 렌더러),
+            "parallel" (구간 분할 병렬 인코딩), "numpy" (버퍼 풀 프레임 합성기)
+        workers: parallel 백엔드 프로세스 수 (None이면 CPU 코어 수)
+        segment_seconds: parallel 백엔드 목표 구간 길이 (None이면 기본값)
+        quality: "final" (1080x1920) 또는 "draft" (540x960, 저 fps, ultrafast 미리보기)
 
     Returns:
         최종 영상 파일 경로
     """
+    if backend not in RENDER_BACKENDS:
+        raise ValueError(f"지원하지 않는 렌더링 백엔드: {backend} (가능: {', '.join(RENDER_BACKENDS)})")
+    if quality not in RENDER_PROFILES:
+        raise ValueError(f"지원하지 않는 렌더링 품질: {quality} (가능: {', '.join(RENDER_PROFILES)})")
+    profile = RENDER_PROFILES[quality]
+
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    if backend == "ffmpeg":
+        from ffmpeg_renderer import render_ffmpeg
+        return render_ffmpeg(audio_path, bg_path, subtitles, output_path, stat_card_path, profile)
+    if backend == "parallel":
+        from parallel_render import render_parallel
+        return render_parallel(
+            audio_path, bg_path, subtitles, output_path, stat_card_path,
+            workers=workers, segment_seconds=segment_seconds, profile=profile,
+        )
+    if backend == "numpy":
+        from frame_compositor import render_numpy
+        return render_numpy(audio_path, bg_path, subtitles, output_path, stat_card_path, profile)
+
     # 1. 오디오 로드
     audio = AudioFileClip(audio_path)
     total_duration = audio.duration  # 오디오 길이에 정확히 맞춤
 
-    # 2. 배경 영상 준비
-    bg_clip = _prepare_background(bg_path, total_duration)
-
-    # 반투명 오버레이 (텍스트 가독성)
-    dark_overlay = (
-        ColorClip(size=(OUTPUT_WIDTH, OUTPUT_HEIGHT), color=(0, 0, 0))
-        .with_opacity(0.3)
-        .with_duration(total_duration)
-    )
-
-    # 3. 자막 클립
-    font_path = _get_font_path()
-    subtitle_clips = _create_subtitle_clips(srt_path, font_path)
-
-    # 4. 합성
-    layers = [bg_clip, dark_overlay] + subtitle_clips
-
-    # 스탯 카드 (있으면)
-    if stat_card_path:
-        stat_clip = _create_stat_overlay(stat_card_path, audio.duration)
-        if stat_clip:
-            layers.append(stat_clip)
-
-    final = CompositeVideoClip(layers, size=(OUTPUT_WIDTH, OUTPUT_HEIGHT))
+    # 2~4. 배경 + 오버레이 + 자막 + 스탯 카드 합성
+    final, bg_clip = build_composite(bg_path, subtitles, stat_card_path, total_duration, profile)
     final = final.with_audio(audio)
-    final = final.with_duration(total_duration)
 
     # 5. 인코딩
     final.write_videofile(
         str(output_path),
-        fps=FPS,
+        fps=profile.fps,
         codec="libx264",
         audio_codec="aac",
-        preset="medium",
+        preset=profile.preset,
         threads=4,
     )
 
     # 리소스 정리
     audio.close()
-    bg_clip.close()
+    if bg_clip:
+        bg_clip.close()
     final.close()
 
     return str(output_path)
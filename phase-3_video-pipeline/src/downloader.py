@@ -0,0 +1,129 @@
+"""
+대용량 파일 다운로더
+- 프로세스 공용 requests.Session (연결 풀 재사용)
+- 1MB 단위 수신 + 수 MB 버퍼 쓰기 (8KB 청크마다 write 호출하지 않음)
+- 연결이 끊기면 받은 지점부터 HTTP Range로 이어받기 (.part 파일은 다음 실행에서도 이어받음)
+- 큰 파일은 구간을 나눠 병렬 다운로드
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+
+CHUNK_SIZE = 1024 * 1024
+WRITE_BUFFER_SIZE = 8 * 1024 * 1024
+PARALLEL_THRESHOLD = 32 * 1024 * 1024   # 이 크기 이상이면 구간 병렬 다운로드
+PARALLEL_PARTS = 4
+MAX_RETRIES = 3
+TIMEOUT = (10, 60)                       # (연결, 읽기) 초
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """프로세스 공용 세션 (스레드 간 공유, 연결 풀 크기 = 병렬 구간 수 이상)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=PARALLEL_PARTS * 2)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def _probe(url: str) -> tuple[int, bool]:
+    """(전체 크기, Range 지원 여부). 알 수 없으면 (0, False)."""
+    try:
+        resp = get_session().head(url, allow_redirects=True, timeout=TIMEOUT)
+        resp.raise_for_status()
+    except requests.RequestException:
+        return 0, False
+    size = int(resp.headers.get("Content-Length") or 0)
+    return size, resp.headers.get("Accept-Ranges", "").lower() == "bytes"
+
+
+def _fetch_range(
+    url: str, path: Path, start: int, end: int | None, mode: str, progress: list[int]
+) -> None:
+    """[start, end] 구간을 path의 start 위치에 기록 (end=None이면 끝까지).
+
+    받은 바이트 수를 progress[0]에 누적 (연결이 끊겨 예외가 나도 이어받을 위치를 알 수 있게).
+    """
+    headers = {"Range": f"bytes={start}-{'' if end is None else end}"} if start or end else {}
+    with get_session().get(url, headers=headers, stream=True, timeout=TIMEOUT) as resp:
+        resp.raise_for_status()
+        if headers and resp.status_code != 206:
+            raise RuntimeError("서버가 Range 요청을 지원하지 않습니다.")
+        with open(path, mode, buffering=WRITE_BUFFER_SIZE) as f:
+            f.seek(start)
+            for chunk in resp.iter_content(chunk_size=CHUNK_SIZE):
+                f.write(chunk)
+                progress[0] += len(chunk)
+
+
+def _download_part(url: str, path: Path, start: int, end: int) -> None:
+    """병렬 구간 하나 (끊기면 받은 지점부터 재시도)."""
+    progress = [0]
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            _fetch_range(url, path, start + progress[0], end, "r+b", progress)
+        except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError):
+            if attempt == MAX_RETRIES:
+                raise
+        if start + progress[0] > end:
+            return
+    raise RuntimeError(f"구간 다운로드 실패: bytes {start + progress[0]}-{end}")
+
+
+def download(url: str, dest: str | Path, parallel: bool = True) -> int:
+    """URL → dest 파일. 중간 결과는 dest + ".part"에 두고 완료 시 교체.
+
+    Args:
+        parallel: False면 크기와 관계없이 한 연결로 받음
+
+    Returns:
+        파일 크기 (bytes)
+    """
+    dest = Path(dest)
+    part = dest.with_name(dest.name + ".part")
+    total, ranges = _probe(url)
+
+    if parallel and ranges and total >= PARALLEL_THRESHOLD:
+        # 크기를 미리 잡아 두고 구간별로 각자 위치에 기록 (.part 이어받기는 단일 연결만)
+        with open(part, "wb") as f:
+            f.truncate(total)
+        step = -(-total // PARALLEL_PARTS)
+        bounds = [(s, min(s + step, total) - 1) for s in range(0, total, step)]
+        with ThreadPoolExecutor(max_workers=len(bounds)) as pool:
+            for future in [pool.submit(_download_part, url, part, s, e) for s, e in bounds]:
+                future.result()
+    else:
+        progress = [part.stat().st_size if ranges and part.exists() else 0]
+        if total and progress[0] > total:
+            progress[0] = 0
+        for attempt in range(MAX_RETRIES + 1):
+            if total and progress[0] >= total:
+                break
+            if attempt:
+                print(f"  - 연결 끊김, {progress[0] / 1024 / 1024:.1f}MB 지점부터 이어받기")
+            try:
+                _fetch_range(url, part, progress[0], None, "r+b" if progress[0] else "wb", progress)
+            except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError):
+                if attempt == MAX_RETRIES or not ranges:
+                    raise
+                continue
+            if not total:
+                break
+
+    size = part.stat().st_size
+    if total and size != total:
+        raise RuntimeError(f"다운로드 크기 불일치: {size} / {total} bytes")
+    os.replace(part, dest)
+    return size
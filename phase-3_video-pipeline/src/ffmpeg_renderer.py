@@ -0,0 +1,233 @@
+"""
+FFmpeg 필터그래프 렌더링 모듈
+- compose_video와 같은 입력을 하나의 ffmpeg 필터그래프로 변환
+- 배경 스케일/크롭 + 어두운 오버레이 + 자막 스프라이트 + 스탯 카드 타이밍 오버레이
+- 자막은 기준 렌더러와 같은 텍스트 스프라이트(PNG)를 같은 위치/프레임 구간에 얹음 (libass 미사용)
+- 프레임이 Python을 거치지 않음 (MoviePy 경로는 기준 렌더러로 유지)
+"""
+
+import math
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from moviepy.config import FFMPEG_BINARY
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+from PIL import Image
+
+from bg_normalizer import is_still_image, normalize_background
+from subtitle import WordTimings
+from text_sprite import render_text_sprite
+from composer import (
+    DARK_OVERLAY_OPACITY,
+    FINAL_PROFILE,
+    OUTPUT_WIDTH,
+    STAT_CARD_DURATION,
+    STAT_CARD_WIDTH,
+    STAT_CARD_Y,
+    SUBTITLE_FONT_SIZE,
+    SUBTITLE_MARGIN_X,
+    SUBTITLE_STROKE_WIDTH,
+    SUBTITLE_Y,
+    RenderProfile,
+    _get_font_path,
+    _load_subtitle_groups,
+    _prepare_still_base,
+    _stat_card_start,
+)
+
+
+@dataclass
+class TimedOverlay:
+    """정해진 프레임 구간 [first, last) 동안 고정 위치에 얹는 RGBA 이미지."""
+    path: Path
+    x: int
+    y: int
+    first: int
+    last: int
+
+
+def _first_frame_at(t: float, fps: int) -> int:
+    """frame / fps >= t 인 첫 프레임 번호 (기준 렌더러의 프레임 시각 계산과 같은 부동소수 비교)."""
+    frame = max(0, math.ceil(t * fps))
+    while frame > 0 and (frame - 1) / fps >= t:
+        frame -= 1
+    while frame / fps < t:
+        frame += 1
+    return frame
+
+
+def _timed_overlay(
+    rgba: np.ndarray, path: Path, x: int, y: int, start: float, end: float, fps: int
+) -> TimedOverlay | None:
+    """RGBA 배열을 PNG로 쓰고 [start, end) 구간에 해당하는 프레임 범위로 변환."""
+    first, last = _first_frame_at(start, fps), _first_frame_at(end, fps)
+    if last <= first:
+        return None
+    Image.fromarray(rgba).save(path)
+    return TimedOverlay(path, x, y, first, last)
+
+
+def build_overlays(
+    subtitles: WordTimings | str,
+    stat_card_path: str | None,
+    total_duration: float,
+    work_dir: Path,
+    profile: RenderProfile = FINAL_PROFILE,
+) -> list[TimedOverlay]:
+    """자막 스프라이트 + 스탯 카드 → 오버레이 목록 (composer._build_overlay_layers와 같은 배치)."""
+    w = profile.width
+    font_path = _get_font_path()
+    overlays = []
+
+    for i, entry in enumerate(_load_subtitle_groups(subtitles)):
+        sprite = render_text_sprite(
+            entry["text"],
+            font_path,
+            font_size=profile.px(SUBTITLE_FONT_SIZE),
+            stroke_width=max(1, profile.px(SUBTITLE_STROKE_WIDTH)),
+            max_width=profile.px(OUTPUT_WIDTH - 2 * SUBTITLE_MARGIN_X),
+        )
+        overlay = _timed_overlay(
+            sprite, work_dir / f"subtitle_{i:04d}.png",
+            (w - sprite.shape[1]) // 2, profile.px(SUBTITLE_Y),
+            entry["start"], entry["end"], profile.fps,
+        )
+        if overlay:
+            overlays.append(overlay)
+
+    if stat_card_path and Path(stat_card_path).exists():
+        with Image.open(stat_card_path) as img:
+            card = img.convert("RGBA")
+        card_w = profile.px(STAT_CARD_WIDTH)
+        card_h = round(card.height * card_w / card.width)
+        card = np.asarray(card.resize((card_w, card_h), Image.LANCZOS))
+        show_at = _stat_card_start(total_duration)
+        overlay = _timed_overlay(
+            card, work_dir / "stat_card.png",
+            (w - card_w) // 2, profile.px(STAT_CARD_Y),
+            show_at, show_at + STAT_CARD_DURATION, profile.fps,
+        )
+        if overlay:
+            overlays.append(overlay)
+
+    return overlays
+
+
+def build_filtergraph(
+    overlays: list[TimedOverlay],
+    bg_mode: str = "raw",
+    profile: RenderProfile = FINAL_PROFILE,
+) -> str:
+    """배경 → 오버레이 → 자막/스탯 카드 필터그래프 문자열.
+
+    입력 순서: 0=배경, 1=오디오, 2부터=overlays 순서대로 (각각 한 장짜리 PNG)
+    bg_mode:
+        "raw" - 원본 영상: 스케일/크롭 + 오버레이
+        "normalized" - 이미 출력 규격: 오버레이만
+        "still" - 오버레이까지 적용된 정지 이미지: 자막/카드만 얹음
+    """
+    w, h = profile.width, profile.height
+    prep = ""
+    if bg_mode == "raw":
+        prep += (
+            f"scale={w}:{h}:force_original_aspect_ratio=increase,"
+            f"crop={w}:{h},setsar=1,fps={profile.fps},"
+        )
+    prep += "format=rgb24"
+    if bg_mode != "still":
+        # 검정 30% 오버레이 = RGB 채널 0.7배 (YUV drawbox는 채도까지 깎이므로 RGB에서 처리)
+        keep = 1.0 - DARK_OVERLAY_OPACITY
+        prep += f",colorchannelmixer=rr={keep:.2f}:gg={keep:.2f}:bb={keep:.2f}"
+    chains = [f"[0:v]{prep}[v0]"]
+
+    # 한 장짜리 입력은 overlay가 마지막 프레임을 계속 재사용 (eof_action=repeat),
+    # 표시 여부는 출력 프레임 번호 n으로 판단해 기준 렌더러와 같은 프레임에만 얹음
+    for i, overlay in enumerate(overlays):
+        chains.append(
+            f"[v{i}][{i + 2}:v]overlay=x={overlay.x}:y={overlay.y}:format=rgb:"
+            f"enable='between(n,{overlay.first},{overlay.last - 1})'[v{i + 1}]"
+        )
+    chains.append(f"[v{len(overlays)}]format=yuv420p[vout]")
+    return ";".join(chains)
+
+
+def render_ffmpeg(
+    audio_path: str,
+    bg_path: str,
+    subtitles: WordTimings | str,
+    output_path: str | Path,
+    stat_card_path: str | None = None,
+    profile: RenderProfile = FINAL_PROFILE,
+) -> str:
+    """compose_video와 같은 결과를 ffmpeg 단일 프로세스로 렌더링.
+
+    Returns:
+        최종 영상 파일 경로
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # 자막/스탯 카드 PNG, 정지 배경 이미지 같은 중간 파일은 임시 디렉토리에 쓰고 렌더링 후 삭제
+    with tempfile.TemporaryDirectory(prefix="mlb_ffmpeg_") as work_dir:
+        return _render_ffmpeg(
+            audio_path, bg_path, subtitles, output_path, stat_card_path, profile, Path(work_dir)
+        )
+
+
+def _render_ffmpeg(
+    audio_path: str,
+    bg_path: str,
+    subtitles: WordTimings | str,
+    output_path: Path,
+    stat_card_path: str | None,
+    profile: RenderProfile,
+    work_dir: Path,
+) -> str:
+    total_duration = ffmpeg_parse_infos(audio_path)["duration"]
+    # 기준 렌더러(MoviePy)와 같은 프레임 수: int(길이 * fps)
+    frame_count = int(total_duration * profile.fps)
+
+    if is_still_image(bg_path):
+        # 정지 배경: 오버레이까지 적용한 한 장을 반복 입력 (디코딩/스케일 없음)
+        base_path = work_dir / "base.png"
+        Image.fromarray(_prepare_still_base(bg_path, profile)).save(base_path)
+        bg_input = ["-loop", "1", "-framerate", str(profile.fps), "-i", str(base_path)]
+        bg_mode = "still"
+    else:
+        try:
+            bg_path = normalize_background(bg_path, profile.width, profile.height, profile.fps)
+            bg_mode = "normalized"
+        except RuntimeError as e:
+            print(f"  - 배경 정규화 실패, 필터그래프에서 리사이즈: {e}")
+            bg_mode = "raw"
+        bg_input = ["-stream_loop", "-1", "-i", str(bg_path)]
+
+    overlays = build_overlays(subtitles, stat_card_path, total_duration, work_dir, profile)
+
+    cmd = [
+        FFMPEG_BINARY, "-y", "-hide_banner", "-loglevel", "error",
+        *bg_input,
+        "-i", str(audio_path),
+    ]
+    for overlay in overlays:
+        cmd += ["-i", str(overlay.path)]
+
+    cmd += [
+        "-filter_complex", build_filtergraph(overlays, bg_mode, profile),
+        "-map", "[vout]", "-map", "1:a",
+        "-frames:v", str(frame_count),
+        "-t", f"{total_duration:.3f}",
+        "-r", str(profile.fps),
+        "-c:v", "libx264", "-preset", profile.preset, "-pix_fmt", "yuv420p",
+        "-c:a", "aac",
+        str(output_path),
+    ]
+
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg 렌더링 실패:\n{proc.stderr.strip()}")
+
+    return str(output_path)
@@ -0,0 +1,130 @@
+"""
+폰트 레지스트리
+- 한국어 폰트 경로를 프로세스당 한 번만 탐색 (번들 폰트 디렉토리 → OS 폰트 디렉토리 → fontconfig)
+- FreeType 폰트 객체를 (경로, 크기)별로 캐시해 스탯 카드/자막 렌더링 때 파일을 다시 열지 않음
+- 자막(composer, text_sprite)과 스탯 카드(graphics)가 공유
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+from PIL import ImageFont
+
+# 저장소에 함께 배포하는 폰트 디렉토리 (MLB_FONT_DIR로 변경 가능)
+BUNDLED_FONT_DIR = Path(
+    os.environ.get("MLB_FONT_DIR", Path(__file__).resolve().parent.parent / "assets" / "fonts")
+)
+
+# 한국어 지원 폰트 파일명 (우선순위 순)
+KOREAN_FONT_FILES = [
+    "malgun.ttf",                   # 맑은 고딕 (Windows)
+    "NanumGothicBold.ttf",
+    "NanumGothic.ttf",
+    "NotoSansKR-Bold.ttf",
+    "NotoSansKR-Regular.ttf",
+    "NotoSansCJK-Bold.ttc",
+    "NotoSansCJK-Regular.ttc",
+    "NotoSansCJKkr-Regular.otf",
+    "AppleSDGothicNeo.ttc",         # macOS
+    "gulim.ttc",
+]
+
+# 한국어 폰트가 없을 때 쓰는 라틴 폰트
+FALLBACK_FONT_FILES = ["arial.ttf", "DejaVuSans.ttf", "LiberationSans-Regular.ttf"]
+
+FONT_CACHE_SIZE = 64
+
+
+def _system_font_dirs() -> list[Path]:
+    """OS별 폰트 디렉토리."""
+    home = Path.home()
+    if sys.platform == "win32":
+        windir = Path(os.environ.get("WINDIR", "C:/Windows"))
+        return [windir / "Fonts", home / "AppData/Local/Microsoft/Windows/Fonts"]
+    if sys.platform == "darwin":
+        return [Path("/System/Library/Fonts"), Path("/Library/Fonts"), home / "Library/Fonts"]
+    return [
+        Path("/usr/share/fonts"),
+        Path("/usr/local/share/fonts"),
+        home / ".local/share/fonts",
+        home / ".fonts",
+    ]
+
+
+def _find_in_dirs(filenames: list[str], dirs: list[Path]) -> str | None:
+    """디렉토리들(하위 포함)에서 파일명 우선순위대로 첫 번째 폰트 경로."""
+    found: dict[str, Path] = {}
+    wanted = {name.lower() for name in filenames}
+    for directory in dirs:
+        if not directory.is_dir():
+            continue
+        for path in directory.rglob("*"):
+            name = path.name.lower()
+            if name in wanted and name not in found:
+                found[name] = path
+    for name in filenames:
+        if name.lower() in found:
+            return str(found[name.lower()])
+    return None
+
+
+def _fontconfig_korean_font() -> str | None:
+    """fontconfig에 등록된 한국어 지원 폰트 (fc-list 없으면 None)."""
+    fc_list = shutil.which("fc-list")
+    if not fc_list:
+        return None
+    try:
+        proc = subprocess.run(
+            [fc_list, ":lang=ko", "file"], capture_output=True, text=True, timeout=10,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    paths = sorted(
+        line.split(":")[0].strip() for line in proc.stdout.splitlines() if line.strip()
+    )
+    # 굵은 글꼴 우선 (자막 가독성)
+    paths.sort(key=lambda p: "bold" not in Path(p).name.lower())
+    return paths[0] if paths else None
+
+
+@lru_cache(maxsize=1)
+def resolve_font_path() -> str | None:
+    """한국어 폰트 경로 (프로세스당 한 번 탐색, 없으면 라틴 폰트, 그것도 없으면 None)."""
+    system_dirs = _system_font_dirs()
+    path = (
+        _find_in_dirs(KOREAN_FONT_FILES, [BUNDLED_FONT_DIR])
+        or _find_in_dirs(KOREAN_FONT_FILES, system_dirs)
+        or _fontconfig_korean_font()
+        or _find_in_dirs(FALLBACK_FONT_FILES, [BUNDLED_FONT_DIR, *system_dirs])
+    )
+    if path is None:
+        print("  - 사용 가능한 폰트가 없어 Pillow 기본 폰트를 사용합니다.")
+    return path
+
+
+@lru_cache(maxsize=FONT_CACHE_SIZE)
+def _load_font(font_path: str | None, size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except OSError as e:
+            print(f"  - 폰트 로드 실패 ({font_path}), 기본 폰트 사용: {e}")
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:
+        # Pillow < 10.1은 크기 지정 불가 (고정 크기 비트맵 폰트)
+        return ImageFont.load_default()
+
+
+def get_font(size: int, font_path: str | None = None) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """(경로, 크기)별로 캐시된 폰트 객체.
+
+    Args:
+        size: 폰트 크기 (px)
+        font_path: 폰트 파일 경로 (None이면 resolve_font_path())
+    """
+    return _load_font(font_path or resolve_font_path(), size)
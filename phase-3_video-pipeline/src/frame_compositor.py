@@ -0,0 +1,255 @@
+"""
+NumPy 프레임 합성기 (버퍼 풀 + 파이프 스트리밍)
+- 고정 개수의 uint8 프레임 버퍼를 미리 할당해 순환 사용
+- 배경 디코더 파이프 → 버퍼에 직접 readinto, 인코더 파이프로 복사 없이 write
+- 어두운 오버레이는 디코더 필터에서 적용, 자막/스탯 카드는 premultiplied 스프라이트를
+  바운딩 박스 영역에만 제자리 블렌딩 (활성 레이어가 없는 프레임은 그대로 통과)
+- 최대 RSS / 프레임당 할당량 리포트
+"""
+
+import queue
+import subprocess
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from moviepy.config import FFMPEG_BINARY
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from bg_normalizer import is_still_image, normalize_background
+from composer import (
+    DARK_OVERLAY_OPACITY,
+    FINAL_PROFILE,
+    RenderProfile,
+    _build_overlay_layers,
+    _prepare_still_base,
+)
+from overlay_layers import OverlayTimeline, restore_regions
+from subtitle import WordTimings
+
+DEFAULT_POOL_SIZE = 4
+ALLOC_SAMPLE_FRAMES = 30
+
+
+@dataclass
+class RenderStats:
+    """합성기 실행 통계."""
+    frames: int = 0
+    passthrough_frames: int = 0
+    blended_pixels: int = 0
+    frame_pixels: int = 0
+    elapsed: float = 0.0
+    peak_rss_mb: float | None = None
+    alloc_kb_per_frame: float | None = None
+
+    def summary(self) -> str:
+        fps = self.frames / self.elapsed if self.elapsed else 0.0
+        rss = f"{self.peak_rss_mb:.0f}MB" if self.peak_rss_mb is not None else "-"
+        alloc = f"{self.alloc_kb_per_frame:.1f}KB" if self.alloc_kb_per_frame is not None else "-"
+        return (
+            f"프레임 {self.frames}장 ({fps:.1f}fps), 통과 {self.passthrough_frames}장, "
+            f"블렌딩 면적 {self.blend_ratio:.1%}, 최대 RSS {rss}, 프레임당 할당 {alloc}"
+        )
+
+    @property
+    def blend_ratio(self) -> float:
+        """전체 프레임 대비 블렌딩한 픽셀 비율 (전체 프레임 합성 대비 작업량)."""
+        total = self.frames * self.frame_pixels
+        return self.blended_pixels / total if total else 0.0
+
+
+def _read_exact(stream, buf: np.ndarray) -> bool:
+    """파이프에서 버퍼 크기만큼 직접 읽기 (중간 bytes 객체 없음)."""
+    view = memoryview(buf).cast("B")
+    filled = 0
+    while filled < len(view):
+        n = stream.readinto(view[filled:])
+        if not n:
+            return False
+        filled += n
+    return True
+
+
+def _peak_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KB, macOS: bytes
+    return peak / 1024 / 1024 if peak > 1 << 32 else peak / 1024
+
+
+def render_numpy(
+    audio_path: str,
+    bg_path: str,
+    subtitles: WordTimings | str,
+    output_path: str | Path,
+    stat_card_path: str | None = None,
+    profile: RenderProfile = FINAL_PROFILE,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    stats: RenderStats | None = None,
+) -> str:
+    """compose_video와 같은 결과를 버퍼 풀 기반 NumPy 합성기로 렌더링.
+
+    Args:
+        pool_size: 미리 할당할 프레임 버퍼 수 (디코딩/합성/인코딩 파이프라인 깊이)
+        stats: 전달하면 실행 통계를 채워 넣음
+
+    Returns:
+        최종 영상 파일 경로
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    stats = stats if stats is not None else RenderStats()
+
+    w, h, fps = profile.width, profile.height, profile.fps
+    total_duration = ffmpeg_parse_infos(audio_path)["duration"]
+    n_frames = int(total_duration * fps)  # MoviePy와 같은 프레임 수
+    timeline = OverlayTimeline(
+        _build_overlay_layers(subtitles, stat_card_path, total_duration, profile)
+    )
+    stats.frame_pixels = w * h
+
+    # 프레임 버퍼 풀 (한 번만 할당). 정지 배경은 버퍼마다 직전에 덮어쓴 영역을 기록해 두고
+    # 다음 사용 때 그 영역만 원본으로 되돌린다 (None이면 아직 배경이 채워지지 않은 버퍼).
+    pool = [np.empty((h, w, 3), dtype=np.uint8) for _ in range(max(2, pool_size))]
+    dirty: dict[int, list | None] = {id(buf): None for buf in pool}
+    free_buffers: queue.Queue = queue.Queue()
+    for buf in pool:
+        free_buffers.put(buf)
+    filled_buffers: queue.Queue = queue.Queue(maxsize=len(pool))
+
+    still_base = None
+    decoder = None
+    if is_still_image(bg_path):
+        still_base = _prepare_still_base(bg_path, profile)
+    else:
+        try:
+            bg_path = normalize_background(bg_path, w, h, fps)
+            fit = ""
+        except RuntimeError as e:
+            print(f"  - 배경 정규화 실패, 디코더에서 리사이즈 사용: {e}")
+            fit = f"scale={w}:{h}:force_original_aspect_ratio=increase,crop={w}:{h},fps={fps},"
+        # 어두운 오버레이는 디코더에서 적용 → 레이어 없는 프레임은 읽은 그대로 인코더로 전달
+        keep = 1.0 - DARK_OVERLAY_OPACITY
+        decoder = subprocess.Popen(
+            [
+                FFMPEG_BINARY, "-hide_banner", "-loglevel", "error",
+                "-stream_loop", "-1", "-i", str(bg_path),
+                "-vf", f"{fit}format=rgb24,colorchannelmixer=rr={keep:.2f}:gg={keep:.2f}:bb={keep:.2f}",
+                "-frames:v", str(n_frames),
+                "-f", "rawvideo", "-pix_fmt", "rgb24", "-",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    encoder = subprocess.Popen(
+        [
+            FFMPEG_BINARY, "-y", "-hide_banner", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{w}x{h}", "-r", str(fps), "-i", "-",
+            "-i", str(audio_path),
+            "-map", "0:v", "-map", "1:a",
+            "-c:v", "libx264", "-preset", profile.preset, "-pix_fmt", "yuv420p",
+            "-c:a", "aac",
+            "-t", f"{total_duration:.3f}",
+            str(output_path),
+        ],
+        stdin=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+
+    write_error: list[Exception] = []
+
+    def _writer() -> None:
+        while True:
+            item = filled_buffers.get()
+            if item is None:
+                break
+            frame, pooled = item
+            try:
+                if not write_error:
+                    encoder.stdin.write(memoryview(frame).cast("B"))
+            except (BrokenPipeError, OSError) as e:
+                write_error.append(e)
+            if pooled:
+                free_buffers.put(frame)
+
+    writer = threading.Thread(target=_writer, daemon=True)
+    writer.start()
+
+    start_time = time.perf_counter()
+    alloc_total = 0
+    tracemalloc.start()
+    try:
+        for i in range(n_frames):
+            if write_error:
+                break
+            layers = timeline.active_at(i / fps)
+
+            sampling = i < ALLOC_SAMPLE_FRAMES
+            if sampling:
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+
+            if still_base is not None and not layers:
+                # 정지 배경 + 레이어 없음: 배경 배열을 그대로 인코더로 (풀 버퍼 사용 안 함)
+                item = (still_base, False)
+                stats.passthrough_frames += 1
+            else:
+                buf = free_buffers.get()
+                if still_base is not None:
+                    if dirty[id(buf)] is None:
+                        np.copyto(buf, still_base)
+                    else:
+                        restore_regions(buf, still_base, dirty[id(buf)])
+                    dirty[id(buf)] = [layer.bbox for layer in layers]
+                elif not _read_exact(decoder.stdout, buf):
+                    free_buffers.put(buf)
+                    raise RuntimeError(f"배경 디코딩이 {i}번째 프레임에서 끝났습니다.")
+                if layers:
+                    stats.blended_pixels += timeline.blend(buf, layers)
+                else:
+                    stats.passthrough_frames += 1
+                item = (buf, True)
+
+            if sampling:
+                alloc_total += tracemalloc.get_traced_memory()[1] - before
+                if i == ALLOC_SAMPLE_FRAMES - 1:
+                    tracemalloc.stop()
+
+            filled_buffers.put(item)
+            stats.frames += 1
+    finally:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        filled_buffers.put(None)
+        writer.join()
+        if decoder is not None:
+            decoder.stdout.close()
+            decoder.kill()
+            decoder.wait()
+        try:
+            encoder.stdin.close()
+        except OSError:
+            pass
+        stderr = encoder.stderr.read().decode("utf-8", errors="replace")
+        encoder.wait()
+
+    if encoder.returncode != 0 or write_error:
+        raise RuntimeError(f"프레임 인코딩 실패:\n{stderr.strip()}")
+
+    stats.elapsed = time.perf_counter() - start_time
+    stats.peak_rss_mb = _peak_rss_mb()
+    sampled = min(stats.frames, ALLOC_SAMPLE_FRAMES)
+    stats.alloc_kb_per_frame = alloc_total / sampled / 1024 if sampled else None
+    print(f"  - {stats.summary()}")
+
+    return str(output_path)
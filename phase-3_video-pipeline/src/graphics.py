@@ -3,11 +3,18 @@ Pillow 스탯 카드 생성 모듈
 - 선수 스탯을 시각적 카드로 생성
 - 반투명 배경 + 텍스트 오버레이
 - 영상 중간에 잠시 표시되는 용도
+- 고정 배경(둥근 사각형 + 악센트 라인)은 한 번만 그리고 카드마다 텍스트만 그림
+- 파일명은 (선수, 스탯, 폰트) 해시 → 같은 카드는 재사용, 동시 실행끼리 덮어쓰지 않음
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 
+from cache_store import cache_dir, content_hash, touch
+from fonts import get_font, resolve_font_path
+
 CARD_WIDTH = 800
 CARD_HEIGHT = 400
 BG_COLOR = (20, 30, 60, 200)  # 반투명 네이비
@@ -16,41 +23,19 @@ TEXT_COLOR = (255, 255, 255)
 FONT_SIZE_TITLE = 36
 FONT_SIZE_STAT = 28
 FONT_SIZE_LABEL = 20
+MAX_STATS = 6
 
-
-def _get_font(size: int) -> ImageFont.FreeTypeFont:
-    """시스템에서 사용 가능한 한국어 폰트 로드."""
-    font_candidates = [
-        "C:/Windows/Fonts/malgun.ttf",       # 맑은 고딕
-        "C:/Windows/Fonts/NanumGothic.ttf",
-        "C:/Windows/Fonts/gulim.ttc",
-        "C:/Windows/Fonts/arial.ttf",
-    ]
-    for font_path in font_candidates:
-        if Path(font_path).exists():
-            return ImageFont.truetype(font_path, size)
-    return ImageFont.load_default()
+STAT_CARD_VERSION = 1
 
 
-def create_stat_card(
-    player_name: str,
-    stats: dict,
-    output_dir: str | Path,
-) -> str:
-    """선수 스탯 카드 PNG 생성.
-
-    Args:
-        player_name: 선수 이름
-        stats: {"타율": ".312", "홈런": "25", ...} 딕셔너리
-        output_dir: 출력 디렉토리
+def _get_font(size: int) -> ImageFont.FreeTypeFont:
+    """한국어 폰트 로드 (폰트 레지스트리 캐시 공유)."""
+    return get_font(size)
 
-    Returns:
-        생성된 PNG 파일 경로
-    """
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    card_path = output_dir / "stat_card.png"
 
+@lru_cache(maxsize=1)
+def _card_template() -> Image.Image:
+    """텍스트를 제외한 카드 배경 (프로세스당 한 번 렌더링, 사용 시 copy)."""
     img = Image.new("RGBA", (CARD_WIDTH, CARD_HEIGHT), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
 
@@ -63,6 +48,19 @@ def create_stat_card(
 
     # 상단 악센트 라인
     draw.rectangle([(20, 15), (CARD_WIDTH - 20, 20)], fill=ACCENT_COLOR)
+    return img
+
+
+def stat_card_key(player_name: str, stats: dict | None) -> str:
+    """카드 내용 해시 (표시되는 스탯 항목 + 폰트까지 반영)."""
+    items = [(str(k), str(v)) for k, v in list((stats or {}).items())[:MAX_STATS]]
+    return content_hash(STAT_CARD_VERSION, player_name, items, resolve_font_path())
+
+
+def _render_card(player_name: str, stats: dict | None) -> Image.Image:
+    """템플릿 복사본 위에 선수 이름/스탯 텍스트만 그림."""
+    img = _card_template().copy()
+    draw = ImageDraw.Draw(img)
 
     # 선수 이름
     font_title = _get_font(FONT_SIZE_TITLE)
@@ -73,7 +71,7 @@ def create_stat_card(
     font_stat = _get_font(FONT_SIZE_STAT)
 
     if stats:
-        stat_items = list(stats.items())[:6]  # 최대 6개
+        stat_items = list(stats.items())[:MAX_STATS]
         cols = min(3, len(stat_items))
         col_width = (CARD_WIDTH - 80) // cols
         y_start = 110
@@ -87,5 +85,60 @@ def create_stat_card(
             draw.text((x, y), str(label), font=font_label, fill=(180, 190, 210))
             draw.text((x, y + 30), str(value), font=font_stat, fill=TEXT_COLOR)
 
-    img.save(card_path, "PNG")
+    return img
+
+
+def create_stat_card(
+    player_name: str,
+    stats: dict,
+    output_dir: str | Path | None = None,
+) -> str:
+    """선수 스탯 카드 PNG 생성 (같은 내용의 카드가 이미 있으면 재사용).
+
+    Args:
+        player_name: 선수 이름
+        stats: {"타율": ".312", "홈런": "25", ...} 딕셔너리
+        output_dir: 출력 디렉토리 (None이면 영상 간 공유 캐시 디렉토리)
+
+    Returns:
+        생성된 PNG 파일 경로 (stat_card_<내용 해시>.png)
+    """
+    output_dir = Path(output_dir) if output_dir else cache_dir("stat_cards")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    card_path = output_dir / f"stat_card_{stat_card_key(player_name, stats)[:16]}.png"
+
+    if card_path.exists():
+        touch(card_path)
+        return str(card_path)
+
+    tmp_path = card_path.with_name(f"{card_path.stem}.{os.getpid()}.tmp")
+    _render_card(player_name, stats).save(tmp_path, "PNG")
+    os.replace(tmp_path, card_path)
     return str(card_path)
+
+
+def create_stat_cards(
+    main_news: list[dict],
+    output_dir: str | Path | None = None,
+) -> list[str | None]:
+    """하루치 main_news 전체의 스탯 카드를 한 번에 생성.
+
+    뉴스마다 첫 번째 선수와 stats 딕셔너리로 카드를 만든다 (stage_video와 같은 규칙).
+    내용이 같은 카드는 한 번만 렌더링된다.
+
+    Args:
+        main_news: 뉴스 리스트 (각 항목의 "players", "stats" 사용)
+        output_dir: 출력 디렉토리 (None이면 영상 간 공유 캐시 디렉토리)
+
+    Returns:
+        main_news 순서대로 카드 경로 (선수/스탯이 없는 뉴스는 None)
+    """
+    paths: list[str | None] = []
+    for news in main_news:
+        players = news.get("players") or []
+        stats = news.get("stats")
+        if players and isinstance(stats, dict) and stats:
+            paths.append(create_stat_card(players[0], stats, output_dir))
+        else:
+            paths.append(None)
+    return paths
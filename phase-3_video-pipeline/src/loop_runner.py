@@ -0,0 +1,61 @@
+"""
+프로세스 공용 asyncio 이벤트 루프
+- 백그라운드 스레드 하나에서 계속 도는 루프 (호출마다 asyncio.run으로 루프를 만들고 닫지 않음)
+- 동기 코드는 run_sync(coro)로 코루틴을 맡기고 결과를 기다림
+- 다른 이벤트 루프 안에서 실행 중인 코드에서도 호출 가능 (가능하면 async API를 직접 await)
+"""
+
+import asyncio
+import atexit
+import threading
+from collections.abc import Coroutine
+
+_loop: asyncio.AbstractEventLoop | None = None
+_thread: threading.Thread | None = None
+_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """공용 루프 (처음 호출 시 백그라운드 스레드에서 시작)."""
+    global _loop, _thread
+    with _lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="mlb-event-loop", daemon=True)
+            thread.start()
+            _loop, _thread = loop, thread
+        return _loop
+
+
+def run_sync(coro: Coroutine, timeout: float | None = None):
+    """코루틴을 공용 루프에서 실행하고 결과를 기다림 (동기 호출용)."""
+    loop = get_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("공용 이벤트 루프 안에서는 run_sync 대신 await를 사용하세요.")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+
+
+def shutdown() -> None:
+    """공용 루프 정지 (프로세스 종료 시 자동 호출)."""
+    global _loop, _thread
+    with _lock:
+        loop, thread = _loop, _thread
+        _loop = _thread = None
+    if loop is None or loop.is_closed():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(loop.shutdown_asyncgens(), loop).result(5)
+    except Exception:
+        pass
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+    if not loop.is_running():
+        loop.close()
+
+
+atexit.register(shutdown)
@@ -0,0 +1,158 @@
+"""
+몽타주 배경 빌더
+- 정규화된 배경(고정 GOP)을 키프레임 경계에서 수 초 단위 구간으로 미리 잘라 캐시 (stream copy)
+- 여러 클립의 구간을 번갈아 이어 필요한 길이의 배경을 concat demuxer stream copy로 조립
+- 재인코딩이 없어 영상마다 배경 트랙 비용이 거의 들지 않고, 한 클립 반복보다 다양함
+"""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+from moviepy.config import FFMPEG_BINARY
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+from bg_normalizer import CACHE_NAME as NORMALIZED_CACHE_NAME
+from bg_normalizer import GOP_SECONDS, normalize_background
+from cache_store import cache_dir, content_hash, evict_lru, touch
+
+SEGMENT_CACHE_NAME = "montage_segments"
+SEGMENT_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+SEGMENT_SECONDS = GOP_SECONDS * 2     # GOP 배수여야 구간 경계가 키프레임에 맞음
+MIN_SEGMENT_SECONDS = 1.0             # 클립 끝의 너무 짧은 자투리는 사용하지 않음
+# B프레임 지연 때문에 경계 키프레임 pts가 경계보다 살짝 앞서므로 허용 오차를 둠
+# (키프레임은 GOP 경계에만 있어 GOP보다 작은 값이면 다른 위치에서 잘리지 않음)
+SEGMENT_TIME_DELTA = 0.1
+MANIFEST_FILE = "segments.json"
+
+
+def precut_segments(normalized_path: str | Path) -> list[tuple[Path, float]]:
+    """정규화 영상 → 키프레임 경계 구간 파일 목록 (캐시 히트 시 재사용).
+
+    Returns:
+        [(구간 파일, 길이 초), ...]
+    """
+    normalized_path = Path(normalized_path)
+    seg_dir = cache_dir(SEGMENT_CACHE_NAME) / normalized_path.stem
+    manifest_path = seg_dir / MANIFEST_FILE
+
+    if manifest_path.exists():
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            segments = [(seg_dir / name, duration) for name, duration in manifest]
+            if all(path.exists() for path, _ in segments):
+                for path, _ in segments:
+                    touch(path)
+                return segments
+        except (OSError, ValueError):
+            pass
+
+    seg_dir.mkdir(parents=True, exist_ok=True)
+    for old in seg_dir.glob("seg_*.mp4"):
+        old.unlink(missing_ok=True)
+    cmd = [
+        FFMPEG_BINARY, "-y", "-hide_banner", "-loglevel", "error",
+        "-i", str(normalized_path),
+        "-map", "0:v", "-c", "copy",
+        "-f", "segment", "-segment_time", str(SEGMENT_SECONDS),
+        "-segment_time_delta", str(SEGMENT_TIME_DELTA),
+        "-reset_timestamps", "1",
+        str(seg_dir / "seg_%03d.mp4"),
+    ]
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"배경 구간 분할 실패:\n{proc.stderr.strip()}")
+
+    segments = []
+    for path in sorted(seg_dir.glob("seg_*.mp4")):
+        duration = ffmpeg_parse_infos(str(path))["duration"]
+        if duration >= MIN_SEGMENT_SECONDS:
+            segments.append((path, duration))
+        else:
+            path.unlink(missing_ok=True)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump([(path.name, duration) for path, duration in segments], f)
+
+    evict_lru(cache_dir(SEGMENT_CACHE_NAME), SEGMENT_CACHE_MAX_BYTES, "*/seg_*.mp4")
+    return segments
+
+
+def plan_montage(
+    clips: list[list[tuple[Path, float]]], duration: float
+) -> list[tuple[Path, float]]:
+    """클립별 구간 목록 → 클립을 번갈아 고른 구간 순서 (합계가 duration 이상).
+
+    같은 클립의 구간은 원래 순서대로, 클립이 바닥나면 처음부터 다시 쓴다.
+    """
+    clips = [segments for segments in clips if segments]
+    if not clips:
+        return []
+    plan = []
+    total = 0.0
+    cursors = [0] * len(clips)
+    i = 0
+    while total < duration:
+        c = i % len(clips)
+        segment = clips[c][cursors[c] % len(clips[c])]
+        cursors[c] += 1
+        plan.append(segment)
+        total += segment[1]
+        i += 1
+    return plan
+
+
+def build_montage(
+    sources: list[str | Path],
+    duration: float,
+    width: int,
+    height: int,
+    fps: int,
+) -> str:
+    """여러 배경 클립으로 duration 이상 길이의 몽타주 배경 생성 (재인코딩 없음).
+
+    결과는 정규화 캐시 디렉토리에 저장되므로 렌더러가 다시 정규화하지 않는다.
+
+    Args:
+        sources: 원본(또는 정규화된) 배경 영상 경로들
+        duration: 필요한 길이 (초)
+        width, height, fps: 출력 규격
+
+    Returns:
+        몽타주 영상 경로
+    """
+    clips = [
+        precut_segments(normalize_background(src, width, height, fps)) for src in sources
+    ]
+    plan = plan_montage(clips, duration)
+    if not plan:
+        raise RuntimeError("몽타주에 사용할 배경 구간이 없습니다.")
+
+    out_dir = cache_dir(NORMALIZED_CACHE_NAME)
+    key = content_hash([(path.parent.name, path.name) for path, _ in plan], width, height, fps)
+    out_path = out_dir / f"montage_{key[:32]}.mp4"
+    if out_path.exists():
+        touch(out_path)
+        return str(out_path)
+
+    list_path = out_dir / f"montage_{key[:32]}.{os.getpid()}.txt"
+    list_path.write_text(
+        "".join(f"file '{path.resolve().as_posix()}'\n" for path, _ in plan), encoding="utf-8"
+    )
+    tmp_path = out_path.with_suffix(f".{os.getpid()}.tmp")
+    cmd = [
+        FFMPEG_BINARY, "-y", "-hide_banner", "-loglevel", "error",
+        "-f", "concat", "-safe", "0", "-i", str(list_path),
+        "-c", "copy", "-movflags", "+faststart",
+        "-f", "mp4", str(tmp_path),
+    ]
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+        if proc.returncode != 0:
+            tmp_path.unlink(missing_ok=True)
+            raise RuntimeError(f"몽타주 조립 실패:\n{proc.stderr.strip()}")
+        tmp_path.replace(out_path)
+    finally:
+        list_path.unlink(missing_ok=True)
+    return str(out_path)
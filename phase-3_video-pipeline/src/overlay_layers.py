@@ -0,0 +1,103 @@
+"""
+오버레이 레이어 (dirty region 합성)
+- 자막/스탯 카드를 premultiplied 스프라이트 + 바운딩 박스 + 표시 구간으로 보관
+- 표시 구간 경계마다 활성 레이어 목록을 미리 계산 (프레임마다 전체 레이어를 훑지 않음)
+- 활성 레이어의 바운딩 박스 영역만 제자리 블렌딩, 활성 레이어가 없는 프레임은 배경 그대로 통과
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+
+import numpy as np
+
+BBox = tuple[int, int, int, int]  # (x0, y0, x1, y1)
+
+
+@dataclass
+class OverlayLayer:
+    """시간 구간 동안 고정 위치에 얹는 premultiplied 스프라이트."""
+    start: float
+    end: float
+    x: int
+    y: int
+    premul: np.ndarray      # (h, w, 3) uint16 = rgb * alpha
+    inv_alpha: np.ndarray   # (h, w, 1) uint16 = 255 - alpha
+
+    @classmethod
+    def from_rgba(
+        cls, rgba: np.ndarray, x: int, y: int, start: float, end: float,
+        frame_w: int, frame_h: int,
+    ) -> "OverlayLayer | None":
+        """RGBA 스프라이트 → 프레임 밖으로 나간 부분을 잘라낸 레이어."""
+        x0, y0 = max(x, 0), max(y, 0)
+        x1 = min(x + rgba.shape[1], frame_w)
+        y1 = min(y + rgba.shape[0], frame_h)
+        if x1 <= x0 or y1 <= y0 or end <= start:
+            return None
+        crop = rgba[y0 - y:y1 - y, x0 - x:x1 - x]
+        alpha = crop[:, :, 3:4].astype(np.uint16)
+        premul = crop[:, :, :3].astype(np.uint16) * alpha
+        return cls(start, end, x0, y0, premul, 255 - alpha)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.premul.shape[0], self.premul.shape[1]
+
+    @property
+    def bbox(self) -> BBox:
+        h, w = self.shape
+        return self.x, self.y, self.x + w, self.y + h
+
+
+def darken_lut(opacity: float) -> np.ndarray:
+    """검정 오버레이(opacity) 합성 = 채널값 (1 - opacity)배 변환표."""
+    return np.round(np.arange(256) * (1.0 - opacity)).astype(np.uint8)
+
+
+class OverlayTimeline:
+    """레이어 표시 구간을 경계 시각으로 나눠 구간별 활성 레이어를 미리 계산.
+
+    블렌딩용 uint16 누산 버퍼는 가장 큰 레이어 크기로 한 번만 할당한다
+    (한 인스턴스는 한 스레드에서만 사용).
+    """
+
+    def __init__(self, layers: list[OverlayLayer]):
+        self.layers = layers
+        self._bounds = sorted({l.start for l in layers} | {l.end for l in layers})
+        self._active = [
+            tuple(l for l in layers if l.start <= t < l.end) for t in self._bounds
+        ]
+        max_h = max((l.shape[0] for l in layers), default=1)
+        max_w = max((l.shape[1] for l in layers), default=1)
+        self._scratch = np.empty((max_h, max_w, 3), dtype=np.uint16)
+
+    def active_at(self, t: float) -> tuple[OverlayLayer, ...]:
+        """시각 t에 표시 중인 레이어 (빈 튜플이면 배경 통과 프레임)."""
+        i = bisect_right(self._bounds, t) - 1
+        return self._active[i] if i >= 0 else ()
+
+    def blend(self, frame: np.ndarray, layers: tuple[OverlayLayer, ...]) -> int:
+        """레이어들을 바운딩 박스 영역에만 제자리 블렌딩.
+
+        Returns:
+            블렌딩한 픽셀 수
+        """
+        pixels = 0
+        for layer in layers:
+            h, w = layer.shape
+            region = frame[layer.y:layer.y + h, layer.x:layer.x + w]
+            # (frame * (255 - a) + rgb * a + 127) // 255, 최대 65152로 uint16 범위 내
+            acc = self._scratch[:h, :w]
+            np.multiply(region, layer.inv_alpha, out=acc)
+            acc += layer.premul
+            acc += 127
+            np.floor_divide(acc, 255, out=acc)
+            np.copyto(region, acc, casting="unsafe")
+            pixels += h * w
+        return pixels
+
+
+def restore_regions(frame: np.ndarray, base: np.ndarray, regions: list[BBox]) -> None:
+    """이전 프레임에서 덮어쓴 영역만 원본 배경으로 되돌림."""
+    for x0, y0, x1, y1 in regions:
+        frame[y0:y1, x0:x1] = base[y0:y1, x0:x1]
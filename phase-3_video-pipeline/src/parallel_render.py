@@ -0,0 +1,166 @@
+"""
+병렬 구간 인코딩 모듈
+- 자막 그룹 경계에서 타임라인을 분할 (프레임 단위로 정렬)
+- 구간별 합성 + 인코딩을 프로세스 풀에서 병렬 실행
+- 구간 영상은 stream copy concat으로 잇고, 오디오는 한 번만 인코딩
+"""
+
+import os
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from moviepy.config import FFMPEG_BINARY
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+from bg_normalizer import normalize_background
+from composer import (
+    FINAL_PROFILE,
+    FPS,
+    RenderProfile,
+    _load_subtitle_groups,
+    build_composite,
+)
+from subtitle import WordTimings
+
+DEFAULT_SEGMENT_SECONDS = 8.0
+
+
+def plan_segments(
+    groups: list[dict],
+    total_duration: float,
+    segment_seconds: float = DEFAULT_SEGMENT_SECONDS,
+    fps: int = FPS,
+) -> list[tuple[int, int]]:
+    """자막 그룹 시작 시각 중에서 구간 경계를 골라 프레임 범위로 반환.
+
+    각 구간은 segment_seconds 이상이 되도록 묶고, 마지막 구간이
+    너무 짧아지면 앞 구간에 합친다.
+
+    Returns:
+        [(시작 프레임, 끝 프레임(미포함)), ...]
+    """
+    total_frames = int(total_duration * fps)  # MoviePy 단일 렌더와 같은 프레임 수
+    min_frames = max(1, int(segment_seconds * fps))
+
+    cuts = []
+    last = 0
+    for entry in groups:
+        frame = round(entry["start"] * fps)
+        if frame - last >= min_frames and total_frames - frame >= min_frames // 2:
+            cuts.append(frame)
+            last = frame
+
+    bounds = [0] + cuts + [total_frames]
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+def _render_segment(
+    bg_path: str,
+    subtitles: WordTimings | str,
+    stat_card_path: str | None,
+    total_duration: float,
+    start_frame: int,
+    end_frame: int,
+    segment_path: str,
+    threads: int,
+    profile: RenderProfile,
+) -> str:
+    """워커 프로세스: 전체 합성 클립에서 한 구간만 잘라 영상 트랙만 인코딩."""
+    final, bg_clip = build_composite(bg_path, subtitles, stat_card_path, total_duration, profile)
+    # MoviePy는 int(duration * fps)장을 쓰므로 반 프레임 여유를 둬 부동소수 오차로 한 장 잃지 않게 함
+    fps = profile.fps
+    end_time = min((end_frame + 0.5) / fps, total_duration)
+    segment = final.subclipped(start_frame / fps, end_time)
+    segment.write_videofile(
+        segment_path,
+        fps=fps,
+        codec="libx264",
+        audio=False,
+        preset=profile.preset,
+        threads=threads,
+        logger=None,
+    )
+    segment.close()
+    if bg_clip:
+        bg_clip.close()
+    final.close()
+    return segment_path
+
+
+def render_parallel(
+    audio_path: str,
+    bg_path: str,
+    subtitles: WordTimings | str,
+    output_path: str | Path,
+    stat_card_path: str | None = None,
+    workers: int | None = None,
+    segment_seconds: float | None = None,
+    profile: RenderProfile = FINAL_PROFILE,
+) -> str:
+    """compose_video와 같은 결과를 구간 병렬 인코딩으로 생성.
+
+    Args:
+        workers: 프로세스 수 (None이면 CPU 코어 수)
+        segment_seconds: 목표 구간 길이 (None이면 DEFAULT_SEGMENT_SECONDS)
+
+    Returns:
+        최종 영상 파일 경로
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    total_duration = ffmpeg_parse_infos(audio_path)["duration"]
+    segments = plan_segments(
+        _load_subtitle_groups(subtitles),
+        total_duration,
+        segment_seconds or DEFAULT_SEGMENT_SECONDS,
+        profile.fps,
+    )
+
+    # 정규화는 부모에서 한 번만 (워커들은 캐시 히트, 정지 이미지는 그대로)
+    try:
+        bg_path = normalize_background(bg_path, profile.width, profile.height, profile.fps)
+    except RuntimeError as e:
+        print(f"  - 배경 정규화 실패, 워커별 리사이즈 사용: {e}")
+
+    cpu_count = os.cpu_count() or 1
+    workers = max(1, min(workers or cpu_count, len(segments)))
+    threads = max(1, cpu_count // workers)
+
+    segment_dir = output_path.parent / f"{output_path.stem}_segments"
+    segment_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    _render_segment,
+                    bg_path, subtitles, stat_card_path, total_duration,
+                    start, end, str(segment_dir / f"seg_{i:04d}.mp4"), threads, profile,
+                )
+                for i, (start, end) in enumerate(segments)
+            ]
+            segment_paths = [f.result() for f in futures]
+
+        list_path = segment_dir / "segments.txt"
+        list_path.write_text(
+            "".join(f"file '{Path(p).resolve().as_posix()}'\n" for p in segment_paths),
+            encoding="utf-8",
+        )
+        cmd = [
+            FFMPEG_BINARY, "-y", "-hide_banner", "-loglevel", "error",
+            "-f", "concat", "-safe", "0", "-i", str(list_path),
+            "-i", str(audio_path),
+            "-map", "0:v", "-map", "1:a",
+            "-c:v", "copy", "-c:a", "aac",
+            "-t", f"{total_duration:.3f}",
+            str(output_path),
+        ]
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"구간 병합 실패:\n{proc.stderr.strip()}")
+    finally:
+        shutil.rmtree(segment_dir, ignore_errors=True)
+
+    return str(output_path)
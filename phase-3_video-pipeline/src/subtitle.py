@@ -1,12 +1,71 @@
 """
 SRT 자막 파싱 → MoviePy 자막 클립 생성 모듈
-- Edge TTS가 출력하는 SRT 파일에서 타임스탬프 추출
+- TTS 엔진이 넘겨주는 단어 경계 타이밍(WordTimings)을 그대로 사용 (파일 왕복 없음)
+- 외부 SRT 파일은 파싱해 같은 형태로 사용
 - MoviePy TextClip 리스트 생성
 """
 
 import re
+from dataclasses import dataclass, field
 from pathlib import Path
 
+TICKS_PER_SECOND = 10_000_000  # Edge TTS offset/duration 단위 (100ns)
+
+
+@dataclass
+class WordTimings:
+    """단어 경계 타이밍 (병렬 배열).
+
+    text는 단어를 공백 하나로 이은 문자열이고, i번째 단어는
+    text[offsets[i]:offsets[i + 1] - 1] (offsets 마지막 값은 len(text) + 1).
+    """
+
+    starts: list[float] = field(default_factory=list)
+    ends: list[float] = field(default_factory=list)
+    offsets: list[int] = field(default_factory=lambda: [0])
+    text: str = ""
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def word(self, i: int) -> str:
+        return self.text[self.offsets[i]:self.offsets[i + 1] - 1]
+
+    @classmethod
+    def from_boundaries(cls, boundaries: list) -> "WordTimings":
+        """[[offset, duration, text], ...] (100ns 단위) → WordTimings."""
+        timings = cls()
+        words = []
+        pos = 0
+        for offset, duration, word in boundaries:
+            word = word.strip()
+            if not word:
+                continue
+            timings.starts.append(offset / TICKS_PER_SECOND)
+            timings.ends.append((offset + duration) / TICKS_PER_SECOND)
+            words.append(word)
+            pos += len(word) + 1
+            timings.offsets.append(pos)
+        timings.text = " ".join(words)
+        return timings
+
+    def to_dict(self) -> dict:
+        return {"starts": self.starts, "ends": self.ends, "offsets": self.offsets, "text": self.text}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "WordTimings":
+        return cls(data["starts"], data["ends"], data["offsets"], data["text"])
+
+    def write_srt(self, srt_path: str | Path) -> str:
+        """SRT 파일로 내보내기 (단어 하나당 항목 하나)."""
+        lines = [
+            f"{i + 1}\n{_seconds_to_time(self.starts[i])} --> {_seconds_to_time(self.ends[i])}\n"
+            f"{self.word(i)}\n\n"
+            for i in range(len(self))
+        ]
+        Path(srt_path).write_text("".join(lines), encoding="utf-8")
+        return str(srt_path)
+
 
 def parse_srt(srt_path: str | Path) -> list[dict]:
     """SRT 자막 파일 파싱.
@@ -43,11 +102,44 @@ def _time_to_seconds(time_str: str) -> float:
     return h * 3600 + m * 60 + s
 
 
-def group_subtitles(entries: list[dict], max_chars: int = 20) -> list[dict]:
+def _seconds_to_time(seconds: float) -> str:
+    """초 → HH:MM:SS,mmm."""
+    ms = round(seconds * 1000)
+    return f"{ms // 3600000:02d}:{ms // 60000 % 60:02d}:{ms // 1000 % 60:02d},{ms % 1000:03d}"
+
+
+def _group_timings(timings: WordTimings, max_chars: int) -> list[dict]:
+    """WordTimings를 문자열을 다시 잇지 않고 offsets만으로 묶음."""
+    grouped = []
+    offsets = timings.offsets
+    first = 0
+    for i in range(1, len(timings) + 1):
+        # first..i 단어를 공백으로 이은 길이 = offsets[i + 1] - 1 - offsets[first]
+        if i < len(timings) and offsets[i + 1] - 1 - offsets[first] <= max_chars:
+            continue
+        grouped.append({
+            "start": timings.starts[first],
+            "end": timings.ends[i - 1],
+            "text": timings.text[offsets[first]:offsets[i] - 1],
+        })
+        first = i
+    return grouped
+
+
+def load_subtitles(subtitles: "WordTimings | str | Path") -> "WordTimings | list[dict]":
+    """WordTimings는 그대로, 경로면 SRT 파싱."""
+    if isinstance(subtitles, WordTimings):
+        return subtitles
+    return parse_srt(subtitles)
+
+
+def group_subtitles(entries: "WordTimings | list[dict]", max_chars: int = 20) -> list[dict]:
     """짧은 자막을 묶어서 자연스러운 단위로 그룹핑.
 
     Edge TTS는 단어 단위로 쪼개므로, 적절한 길이로 합침.
     """
+    if isinstance(entries, WordTimings):
+        return _group_timings(entries, max_chars)
     if not entries:
         return []
 
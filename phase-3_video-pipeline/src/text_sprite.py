@@ -0,0 +1,142 @@
+"""
+자막 스프라이트 래스터라이저
+- (텍스트, 폰트, 크기, 외곽선, 폭) 조합마다 RGBA 스프라이트를 한 번만 렌더링
+- 메모리 LRU + 디스크 PNG 캐시 (영상 간 공유: 구독/좋아요 멘트 등 반복 문구)
+- MoviePy TextClip(method="caption") 대체
+"""
+
+import os
+from collections import OrderedDict
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from cache_store import cache_dir, content_hash, evict_lru, touch
+from fonts import get_font
+
+SPRITE_CACHE_VERSION = 1
+MEMORY_CACHE_SIZE = 256
+DISK_CACHE_MAX_BYTES = 200 * 1024 * 1024
+LINE_SPACING = 1.2
+
+_memory_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+
+
+def sprite_key(
+    text: str,
+    font_path: str,
+    font_size: int,
+    stroke_width: int,
+    max_width: int,
+    color: tuple = (255, 255, 255),
+    stroke_color: tuple = (0, 0, 0),
+) -> str:
+    """스프라이트 캐시 키."""
+    return content_hash(
+        SPRITE_CACHE_VERSION, text, font_path, font_size,
+        stroke_width, max_width, tuple(color), tuple(stroke_color),
+    )
+
+
+def _wrap_text(text: str, font: ImageFont.FreeTypeFont, max_width: int) -> list[str]:
+    """공백 단위 줄바꿈 (한 단어가 폭을 넘으면 글자 단위로 자름)."""
+    lines = []
+    for paragraph in text.splitlines() or [""]:
+        current = ""
+        for word in paragraph.split():
+            candidate = f"{current} {word}" if current else word
+            if font.getlength(candidate) <= max_width:
+                current = candidate
+                continue
+            if current:
+                lines.append(current)
+            current = ""
+            for ch in word:
+                if current and font.getlength(current + ch) > max_width:
+                    lines.append(current)
+                    current = ch
+                else:
+                    current += ch
+        lines.append(current)
+    return lines
+
+
+def _rasterize(
+    text: str,
+    font_path: str,
+    font_size: int,
+    stroke_width: int,
+    max_width: int,
+    color: tuple,
+    stroke_color: tuple,
+) -> np.ndarray:
+    """텍스트 → 가운데 정렬 RGBA 배열 (외곽선 포함 최소 크기)."""
+    font = get_font(font_size, font_path)
+    lines = _wrap_text(text, font, max_width - 2 * stroke_width)
+
+    ascent, descent = font.getmetrics()
+    line_height = int((ascent + descent) * LINE_SPACING)
+    widths = [int(np.ceil(font.getlength(line))) for line in lines]
+    width = max(widths, default=1) + 2 * stroke_width
+    height = line_height * (len(lines) - 1) + ascent + descent + 2 * stroke_width
+
+    img = Image.new("RGBA", (max(width, 1), max(height, 1)), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    for i, (line, line_width) in enumerate(zip(lines, widths)):
+        x = (width - line_width) // 2
+        y = stroke_width + i * line_height
+        draw.text(
+            (x, y), line, font=font, fill=tuple(color),
+            stroke_width=stroke_width, stroke_fill=tuple(stroke_color),
+        )
+    return np.asarray(img)
+
+
+def render_text_sprite(
+    text: str,
+    font_path: str,
+    font_size: int = 52,
+    stroke_width: int = 3,
+    max_width: int = 980,
+    color: tuple = (255, 255, 255),
+    stroke_color: tuple = (0, 0, 0),
+) -> np.ndarray:
+    """자막 텍스트 → RGBA 스프라이트 (메모리 → 디스크 → 렌더링 순으로 조회).
+
+    Returns:
+        (H, W, 4) uint8 배열 (읽기 전용, 캐시 공유)
+    """
+    key = sprite_key(text, font_path, font_size, stroke_width, max_width, color, stroke_color)
+
+    sprite = _memory_cache.get(key)
+    if sprite is not None:
+        _memory_cache.move_to_end(key)
+        return sprite
+
+    sprite_dir = cache_dir("subtitle_sprites")
+    sprite_path = sprite_dir / f"{key}.png"
+    if sprite_path.exists():
+        try:
+            with Image.open(sprite_path) as img:
+                sprite = np.asarray(img.convert("RGBA"))
+            touch(sprite_path)
+        except OSError:
+            sprite = None
+
+    if sprite is None:
+        sprite = _rasterize(text, font_path, font_size, stroke_width, max_width, color, stroke_color)
+        tmp_path = sprite_path.with_suffix(f".{os.getpid()}.tmp")
+        Image.fromarray(sprite).save(tmp_path, "PNG")
+        tmp_path.replace(sprite_path)
+        evict_lru(sprite_dir, DISK_CACHE_MAX_BYTES, "*.png")
+
+    sprite.setflags(write=False)
+    _memory_cache[key] = sprite
+    while len(_memory_cache) > MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+    return sprite
+
+
+def clear_memory_cache() -> None:
+    """메모리 캐시 비우기 (디스크 캐시는 유지)."""
+    _memory_cache.clear()
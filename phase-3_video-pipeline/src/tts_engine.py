@@ -2,59 +2,226 @@
 Edge TTS 음성 생성 모듈
 - Microsoft Edge TTS (무료, 무제한)
 - 한국어 뉴럴 음성 지원
-- 음성 MP3 + 자막 VTT 동시 출력
+- 음성 MP3 + 단어 경계 타이밍(WordTimings) 동시 출력 (SRT 파일은 선택적으로 내보내기)
+- (텍스트, 음성, 엔진 버전) 해시로 MP3 + 단어 경계 타이밍을 로컬 캐시 (같은 대본은 합성 생략)
+- 선택: 문장 단위로 나눠 동시 합성 후 이어 붙임 (문장별 캐시라 대본 수정 시 바뀐 문장만 합성)
+- async API(generate_tts_async) + 동기 API(generate_tts, 프로세스 공용 이벤트 루프에서 실행)
 """
 
 import asyncio
-import edge_tts
+import json
+import os
+import re
 from pathlib import Path
 
+import edge_tts
+
+from asset_cache import materialize
+from cache_store import cache_dir, content_hash, evict_lru, touch
+from loop_runner import run_sync
+from subtitle import TICKS_PER_SECOND, WordTimings
+
 VOICES = {
     "female": "ko-KR-SunHiNeural",
     "male": "ko-KR-InJoonNeural",
 }
 
+TTS_CACHE_NAME = "tts"
+TTS_CACHE_MAX_BYTES = int(os.environ.get("MLB_TTS_CACHE_MAX_MB", "512")) * 1024 * 1024
+# 엔진 버전이 바뀌면 음성/타이밍이 달라질 수 있으므로 캐시 키에 포함
+ENGINE_VERSION = f"edge-tts {edge_tts.__version__}"
 
-async def _generate(text: str, output_dir: Path, voice: str) -> dict:
-    """Edge TTS로 음성 + 자막 생성 (async)."""
-    output_dir.mkdir(parents=True, exist_ok=True)
-    audio_path = output_dir / "tts_audio.mp3"
-    srt_path = output_dir / "tts_subtitle.srt"
+# Edge TTS 출력 형식(audio-24khz-48kbitrate-mono-mp3)은 48kbps CBR → 바이트 수로 길이 계산
+MP3_BYTES_PER_SECOND = 48_000 // 8
+TTS_CONCURRENCY = int(os.environ.get("MLB_TTS_CONCURRENCY", "4"))
+_SENTENCE_END = re.compile(r"(?<=[.!?。])\s+")
 
-    communicate = edge_tts.Communicate(text, voice)
-    submaker = edge_tts.SubMaker()
 
-    with open(audio_path, "wb") as f:
-        async for chunk in communicate.stream():
-            if chunk["type"] == "audio":
-                f.write(chunk["data"])
-            elif chunk["type"] == "WordBoundary":
-                submaker.feed(chunk)
+def tts_cache_key(text: str, voice: str) -> str:
+    """TTS 캐시 키 (텍스트, 음성, 엔진 버전)."""
+    return content_hash(text, voice, ENGINE_VERSION)[:32]
 
-    with open(srt_path, "w", encoding="utf-8") as f:
-        f.write(submaker.get_srt())
 
-    return {
-        "audio_path": str(audio_path),
-        "srt_path": str(srt_path),
-    }
+def _cache_paths(key: str) -> tuple[Path, Path]:
+    directory = cache_dir(TTS_CACHE_NAME)
+    return directory / f"{key}.mp3", directory / f"{key}.json"
+
+
+def _load_cached(key: str) -> tuple[Path, list] | None:
+    """캐시된 (MP3 경로, 단어 경계 목록). 없거나 읽을 수 없으면 None."""
+    audio_path, meta_path = _cache_paths(key)
+    if not audio_path.exists():
+        return None
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            boundaries = json.load(f)["boundaries"]
+    except (OSError, ValueError, KeyError):
+        return None
+    touch(audio_path)
+    return audio_path, boundaries
+
+
+def _store_cached(key: str, audio: bytes, boundaries: list) -> Path:
+    """MP3 + 단어 경계를 캐시에 저장 (임시 파일에 쓰고 교체)."""
+    audio_path, meta_path = _cache_paths(key)
+    suffix = f".{os.getpid()}.tmp"
+    tmp_meta = meta_path.with_name(meta_path.name + suffix)
+    with open(tmp_meta, "w", encoding="utf-8") as f:
+        json.dump({"engine": ENGINE_VERSION, "boundaries": boundaries}, f, ensure_ascii=False)
+    os.replace(tmp_meta, meta_path)
+    # MP3가 마지막에 생겨야 조회 시 타이밍이 항상 함께 있음
+    tmp_audio = audio_path.with_name(audio_path.name + suffix)
+    tmp_audio.write_bytes(audio)
+    os.replace(tmp_audio, audio_path)
+
+    if evict_lru(audio_path.parent, TTS_CACHE_MAX_BYTES, "*.mp3"):
+        for stale in audio_path.parent.glob("*.json"):
+            if not stale.with_suffix(".mp3").exists():
+                stale.unlink(missing_ok=True)
+    return audio_path
+
+
+async def _synthesize(text: str, voice: str) -> tuple[bytes, list]:
+    """Edge TTS로 음성 합성 (async).
+
+    Returns:
+        (MP3 바이트, [[offset, duration, text], ...])  offset/duration 단위는 100ns
+    """
+    communicate = edge_tts.Communicate(text, voice, boundary="WordBoundary")
+    audio = bytearray()
+    boundaries = []
+    async for chunk in communicate.stream():
+        if chunk["type"] == "audio":
+            audio += chunk["data"]
+        elif chunk["type"] == "WordBoundary":
+            boundaries.append([chunk["offset"], chunk["duration"], chunk["text"]])
+    return bytes(audio), boundaries
+
+
+def split_sentences(text: str) -> list[str]:
+    """대본 → 문장 목록 (문장부호 뒤 공백 기준)."""
+    return [s for s in _SENTENCE_END.split(text.strip()) if s.strip()]
+
+
+async def _synthesize_chunks(
+    sentences: list[str], voice: str, concurrency: int, use_cache: bool
+) -> tuple[bytes, list, int]:
+    """문장별 합성 (캐시에 없는 문장만, 최대 concurrency개 동시) 후 하나로 이어 붙임.
+
+    Returns:
+        (MP3 바이트, 전체 타임라인 기준 단어 경계 목록, 캐시 히트 문장 수)
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def one(sentence: str) -> tuple[bytes, list, bool]:
+        key = tts_cache_key(sentence, voice)
+        cached = _load_cached(key) if use_cache else None
+        if cached:
+            cached_audio, boundaries = cached
+            return cached_audio.read_bytes(), boundaries, True
+        async with semaphore:
+            audio, boundaries = await _synthesize(sentence, voice)
+        if use_cache:
+            _store_cached(key, audio, boundaries)
+        return audio, boundaries, False
+
+    parts = await asyncio.gather(*(one(s) for s in sentences))
+
+    # MP3는 프레임 단위라 바이트를 그대로 이어도 재생 가능, 각 문장 길이만큼 경계를 이동
+    audio = bytearray()
+    boundaries = []
+    for part_audio, part_boundaries, _ in parts:
+        shift = len(audio) * TICKS_PER_SECOND // MP3_BYTES_PER_SECOND
+        boundaries.extend([offset + shift, duration, word] for offset, duration, word in part_boundaries)
+        audio += part_audio
+    return bytes(audio), boundaries, sum(hit for _, _, hit in parts)
 
 
 def generate_tts(
     text: str,
     output_dir: str | Path,
     voice_type: str = "male",
+    use_cache: bool = True,
+    chunked: bool = False,
+    concurrency: int = TTS_CONCURRENCY,
+    export_srt: bool = False,
+) -> dict:
+    """generate_tts_async의 동기 버전 (프로세스 공용 이벤트 루프에서 실행).
+
+    호출마다 이벤트 루프를 새로 만들지 않으며, 이미 루프 안에서 도는 코드에서도 호출할 수 있다.
+    인자/반환값은 generate_tts_async와 같다.
+    """
+    return run_sync(
+        generate_tts_async(text, output_dir, voice_type, use_cache, chunked, concurrency, export_srt)
+    )
+
+
+async def generate_tts_async(
+    text: str,
+    output_dir: str | Path,
+    voice_type: str = "male",
+    use_cache: bool = True,
+    chunked: bool = False,
+    concurrency: int = TTS_CONCURRENCY,
+    export_srt: bool = False,
 ) -> dict:
-    """대본 텍스트 → MP3 음성 + VTT 자막 생성.
+    """대본 텍스트 → MP3 음성 + 단어 타이밍 생성 (async).
+
+    같은 텍스트/음성은 TTS 캐시에서 링크(또는 복사)만 하고 다시 합성하지 않는다.
+    여러 영상의 TTS를 한 루프에서 asyncio.gather로 동시에 기다릴 수 있다 (output_dir은 각각 달라야 함).
 
     Args:
         text: 대본 전체 텍스트
         output_dir: 출력 디렉토리
         voice_type: "male" 또는 "female"
+        use_cache: False면 캐시를 무시하고 합성 (결과도 저장하지 않음)
+        chunked: True면 문장 단위로 나눠 동시 합성 후 이어 붙임 (문장별 캐시)
+        concurrency: chunked 모드 동시 합성 수
+        export_srt: True면 output_dir/tts_subtitle.srt도 기록 (렌더링에는 필요 없음)
 
     Returns:
-        {"audio_path": str, "srt_path": str}
+        {"audio_path": str, "timings": WordTimings, "srt_path": str | None, "cached": bool}
     """
     voice = VOICES.get(voice_type, VOICES["male"])
     output_dir = Path(output_dir)
-    return asyncio.run(_generate(text, output_dir, voice))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    audio_path = output_dir / "tts_audio.mp3"
+    # 이전 실행이 캐시 파일을 하드링크해 둔 경우 덮어쓰면 캐시까지 바뀌므로 먼저 끊음
+    audio_path.unlink(missing_ok=True)
+
+    if chunked:
+        sentences = split_sentences(text)
+        audio, boundaries, hits = await _synthesize_chunks(sentences, voice, concurrency, use_cache)
+        print(f"  - 문장 {len(sentences)}개 중 {len(sentences) - hits}개 합성 (캐시 {hits}개)")
+        audio_path.write_bytes(audio)
+        return _result(audio_path, boundaries, export_srt, hits == len(sentences))
+
+    key = tts_cache_key(text, voice)
+    cached = _load_cached(key) if use_cache else None
+    if cached:
+        cached_audio, boundaries = cached
+        print(f"  - TTS 캐시 히트: {cached_audio.name}")
+    else:
+        audio, boundaries = await _synthesize(text, voice)
+        if use_cache:
+            cached_audio = _store_cached(key, audio, boundaries)
+        else:
+            audio_path.write_bytes(audio)
+
+    if use_cache:
+        materialize(cached_audio, audio_path)
+    return _result(audio_path, boundaries, export_srt, cached is not None)
+
+
+def _result(audio_path: Path, boundaries: list, export_srt: bool, cached: bool) -> dict:
+    """generate_tts 반환값 (단어 경계 → WordTimings, 필요하면 SRT 내보내기)."""
+    timings = WordTimings.from_boundaries(boundaries)
+    srt_path = None
+    if export_srt:
+        srt_path = timings.write_srt(audio_path.with_name("tts_subtitle.srt"))
+    return {
+        "audio_path": str(audio_path),
+        "timings": timings,
+        "srt_path": srt_path,
+        "cached": cached,
+    }
@@ -5,6 +5,8 @@ MLB Daily AI Creator - Phase 3
 Usage:
     python main.py --script "대본 텍스트"
     python main.py --script-file script.json
+    python main.py --script-file script.json --draft
+    python main.py --promote outputs/20260101_070000
 """
 
 import argparse
@@ -29,13 +31,17 @@ load_dotenv(Path(__file__).resolve().parent.parent / ".env")
 
 from tts_engine import generate_tts
 from background import download_background
-from subtitle import parse_srt, group_subtitles
+from bg_pool import take_background
+from subtitle import WordTimings
 from graphics import create_stat_card
-from composer import compose_video
+from composer import FINAL_PROFILE, RENDER_BACKENDS, compose_video
 
 # 기본 출력 디렉토리
 DEFAULT_OUTPUT_DIR = Path(__file__).resolve().parent.parent / "outputs"
 
+# 렌더링 입력 기록 (초안 → 최종 렌더링 승격 시 TTS/배경 재사용)
+RENDER_JOB_FILE = "render_job.json"
+
 
 def run_pipeline(
     script_text: str,
@@ -45,6 +51,13 @@ def run_pipeline(
     player_name: str | None = None,
     stats: dict | None = None,
     bg_query: str | None = None,
+    render_backend: str = "moviepy",
+    render_workers: int | None = None,
+    render_segment_seconds: float | None = None,
+    draft: bool = False,
+    bg_montage_clips: int = 0,
+    tts_chunked: bool = False,
+    export_srt: bool = False,
 ) -> str:
     """영상 생성 파이프라인 실행.
 
@@ -56,9 +69,18 @@ def run_pipeline(
         player_name: 스탯 카드에 표시할 선수 이름
         stats: 스탯 딕셔너리
         bg_query: 배경 영상 검색 키워드
+        render_backend: "moviepy" (기준 렌더러), "ffmpeg" (필터그래프 렌더러),
+            "parallel" (구간 분할 병렬 인코딩), "numpy" (버퍼 풀 프레임 합성기)
+        render_workers: parallel 백엔드 프로세스 수 (None이면 CPU 코어 수)
+        render_segment_seconds: parallel 백엔드 목표 구간 길이 (None이면 기본값)
+        draft: True면 540x960 저화질 초안(draft.mp4)만 렌더링.
+            같은 출력 디렉토리로 promote_draft()를 호출하면 최종 품질로 재렌더링
+        bg_montage_clips: 2 이상이면 배경 클립 여러 개의 구간을 이어 붙인 몽타주 배경 사용
+        tts_chunked: True면 대본을 문장 단위로 나눠 동시 합성 (긴 대본의 TTS 대기 시간 단축)
+        export_srt: True면 작업 디렉토리에 tts_subtitle.srt도 기록 (렌더링은 메모리의 단어 타이밍 사용)
 
     Returns:
-        최종 영상 파일 경로
+        최종 영상 파일 경로 (draft=True면 초안 파일 경로)
     """
     if output_dir is None:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -71,13 +93,33 @@ def run_pipeline(
 
     # Step 1: TTS 음성 생성
     print("[1/4] TTS 음성 생성 중...")
-    tts_result = generate_tts(script_text, work_dir, voice_type)
+    # 같은 대본/음성이면 TTS 캐시에서 가져오고 합성은 건너뜀
+    tts_result = generate_tts(
+        script_text, work_dir, voice_type, chunked=tts_chunked, export_srt=export_srt
+    )
+    timings = tts_result["timings"]
     print(f"  - 음성: {tts_result['audio_path']}")
-    print(f"  - 자막: {tts_result['srt_path']}")
+    print(f"  - 자막: 단어 {len(timings)}개")
+    if tts_result["srt_path"]:
+        print(f"  - SRT: {tts_result['srt_path']}")
 
-    # Step 2: 배경 영상 다운로드
+    # Step 2: 배경 영상 (몽타주 → 예열 풀 → 다운로드 → 단색 배경)
     pexels_key = pexels_api_key or os.environ.get("PEXELS_API_KEY", "")
-    if pexels_key:
+    montage_bg = None
+    if bg_montage_clips > 1:
+        montage_bg = _create_montage_background(
+            work_dir, tts_result["audio_path"], pexels_key, bg_query, bg_montage_clips
+        )
+    pooled_bg = None if montage_bg else take_background(work_dir, bg_query)
+    if montage_bg:
+        print(f"[2/4] 몽타주 배경 사용 (클립 {bg_montage_clips}개)")
+        bg_path = montage_bg
+        print(f"  - 배경: {bg_path}")
+    elif pooled_bg:
+        print("[2/4] 예열 풀에서 배경 사용")
+        bg_path = pooled_bg
+        print(f"  - 배경: {bg_path}")
+    elif pexels_key:
         print("[2/4] 배경 영상 다운로드 중...")
         try:
             bg_path = download_background(pexels_key, work_dir, bg_query)
@@ -93,32 +135,142 @@ def run_pipeline(
     stat_card_path = None
     if player_name and stats:
         print("[3/4] 스탯 카드 생성 중...")
-        stat_card_path = create_stat_card(player_name, stats, work_dir)
+        # 공유 캐시 디렉토리: create_stat_cards()로 미리 만든 카드나 이전 실행의 같은 카드를 재사용
+        stat_card_path = create_stat_card(player_name, stats)
         print(f"  - 카드: {stat_card_path}")
     else:
         print("[3/4] 스탯 카드 스킵 (선수 정보 없음)")
 
+    job = {
+        "audio_path": tts_result["audio_path"],
+        "bg_path": bg_path,
+        "timings": timings.to_dict(),
+        "stat_card_path": stat_card_path,
+    }
+    with open(output_dir / RENDER_JOB_FILE, "w", encoding="utf-8") as f:
+        json.dump(job, f, ensure_ascii=False, indent=2)
+
     # Step 4: 영상 합성
-    print("[4/4] 영상 합성 중...")
-    final_path = output_dir / "output.mp4"
-    result = compose_video(
-        audio_path=tts_result["audio_path"],
-        bg_path=bg_path,
-        srt_path=tts_result["srt_path"],
-        output_path=final_path,
-        stat_card_path=stat_card_path,
+    quality = "draft" if draft else "final"
+    print(f"[4/4] 영상 합성 중... (백엔드: {render_backend}, 품질: {quality})")
+    result = _render_job(
+        job, output_dir, quality, render_backend, render_workers, render_segment_seconds, timings
+    )
+    print(f"  - 완성: {result}")
+    return result
+
+
+def promote_draft(
+    output_dir: str | Path,
+    render_backend: str = "moviepy",
+    render_workers: int | None = None,
+    render_segment_seconds: float | None = None,
+) -> str:
+    """초안을 만든 출력 디렉토리의 TTS/자막/배경을 재사용해 최종 품질로 렌더링.
+
+    Args:
+        output_dir: run_pipeline(draft=True)가 사용한 출력 디렉토리
+        render_backend: 렌더링 백엔드
+        render_workers: parallel 백엔드 프로세스 수
+        render_segment_seconds: parallel 백엔드 목표 구간 길이
+
+    Returns:
+        최종 영상 파일 경로
+    """
+    output_dir = Path(output_dir)
+    job_path = output_dir / RENDER_JOB_FILE
+    if not job_path.exists():
+        raise FileNotFoundError(f"렌더링 기록이 없습니다: {job_path}")
+    with open(job_path, "r", encoding="utf-8") as f:
+        job = json.load(f)
+
+    print(f"최종 렌더링 중... (백엔드: {render_backend})")
+    result = _render_job(
+        job, output_dir, "final", render_backend, render_workers, render_segment_seconds
     )
     print(f"  - 완성: {result}")
     return result
 
 
+def _render_job(
+    job: dict,
+    output_dir: Path,
+    quality: str,
+    render_backend: str,
+    render_workers: int | None,
+    render_segment_seconds: float | None = None,
+    timings: WordTimings | None = None,
+) -> str:
+    """렌더링 기록 → compose_video 호출 (초안: draft.mp4, 최종: output.mp4).
+
+    timings가 없으면 기록된 단어 타이밍 (이전 형식의 기록이면 SRT 파일 경로)을 사용.
+    """
+    filename = "draft.mp4" if quality == "draft" else "output.mp4"
+    if timings is None:
+        timings = WordTimings.from_dict(job["timings"]) if "timings" in job else job["srt_path"]
+    return compose_video(
+        audio_path=job["audio_path"],
+        bg_path=job["bg_path"],
+        subtitles=timings,
+        output_path=output_dir / filename,
+        stat_card_path=job.get("stat_card_path"),
+        backend=render_backend,
+        workers=render_workers,
+        segment_seconds=render_segment_seconds,
+        quality=quality,
+    )
+
+
+def _create_montage_background(
+    work_dir: Path,
+    audio_path: str,
+    pexels_key: str,
+    bg_query: str | None,
+    clips: int,
+) -> str | None:
+    """예열 풀/Pexels 캐시에서 클립을 모아 음성 길이만큼의 몽타주 배경 생성.
+
+    최종 규격으로 만들어 두므로 초안 → 최종 승격 때도 그대로 재사용된다.
+    클립이 2개 미만이거나 실패하면 None (단일 배경 경로로 진행).
+    """
+    from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+    from background import fetch_background
+    from montage import build_montage
+
+    sources = []
+    for i in range(clips):
+        source = take_background(work_dir, bg_query, filename=f"montage_src_{i}.mp4")
+        if source is None and pexels_key:
+            try:
+                source = fetch_background(pexels_key, bg_query)
+            except Exception as e:
+                print(f"  - 몽타주 클립 다운로드 실패: {e}")
+        if source is None:
+            break
+        sources.append(source)
+
+    if len(sources) < 2:
+        return None
+    try:
+        duration = ffmpeg_parse_infos(audio_path)["duration"]
+        return build_montage(
+            sources, duration, FINAL_PROFILE.width, FINAL_PROFILE.height, FINAL_PROFILE.fps
+        )
+    except RuntimeError as e:
+        print(f"  - 몽타주 생성 실패, 단일 배경 사용: {e}")
+        return None
+
+
 def _create_solid_background(work_dir: Path) -> str:
-    """Pexels 키가 없을 때 단색 배경 영상 생성."""
-    from moviepy import ColorClip
-    bg_path = work_dir / "background.mp4"
-    clip = ColorClip(size=(1080, 1920), color=(15, 25, 55), duration=120)
-    clip.write_videofile(str(bg_path), fps=30, codec="libx264", audio=False, logger=None)
-    clip.close()
+    """Pexels 키가 없을 때 단색 배경 이미지 생성.
+
+    영상으로 인코딩하지 않고 정지 이미지 한 장만 저장 → 합성 단계에서
+    디코딩 없이 정지 배경 경로로 처리됨.
+    """
+    from PIL import Image
+    bg_path = work_dir / "background.png"
+    Image.new("RGB", (1080, 1920), (15, 25, 55)).save(bg_path)
     return str(bg_path)
 
 
@@ -130,8 +282,30 @@ def main():
     parser.add_argument("--output-dir", type=str, default=None)
     parser.add_argument("--pexels-key", type=str, default=None)
     parser.add_argument("--bg-query", type=str, default=None)
+    parser.add_argument("--backend", type=str, default="moviepy", choices=RENDER_BACKENDS)
+    parser.add_argument("--workers", type=int, default=None, help="parallel 백엔드 프로세스 수")
+    parser.add_argument("--segment-seconds", type=float, default=None,
+                        help="parallel 백엔드 목표 구간 길이 (초)")
+    parser.add_argument("--draft", action="store_true", help="540x960 저화질 초안만 렌더링")
+    parser.add_argument("--montage", type=int, default=0, metavar="N",
+                        help="배경 클립 N개를 이어 붙인 몽타주 배경 사용 (2 이상)")
+    parser.add_argument("--tts-chunked", action="store_true",
+                        help="대본을 문장 단위로 나눠 동시에 음성 합성")
+    parser.add_argument("--srt", action="store_true", help="작업 디렉토리에 SRT 자막 파일도 저장")
+    parser.add_argument("--promote", type=str, default=None, metavar="OUTPUT_DIR",
+                        help="초안 출력 디렉토리를 최종 품질로 재렌더링")
     args = parser.parse_args()
 
+    if args.promote:
+        result = promote_draft(
+            args.promote,
+            render_backend=args.backend,
+            render_workers=args.workers,
+            render_segment_seconds=args.segment_seconds,
+        )
+        print(f"\n최종 영상 생성 완료: {result}")
+        return
+
     # 대본 텍스트 결정
     if args.script:
         script_text = args.script
@@ -160,6 +334,13 @@ def main():
         player_name=player_name,
         stats=stats,
         bg_query=args.bg_query,
+        render_backend=args.backend,
+        render_workers=args.workers,
+        render_segment_seconds=args.segment_seconds,
+        draft=args.draft,
+        bg_montage_clips=args.montage,
+        tts_chunked=args.tts_chunked,
+        export_srt=args.srt,
     )
     print(f"\n영상 생성 완료: {result}")
 
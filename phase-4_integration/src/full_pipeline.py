@@ -51,6 +51,9 @@ class PipelineOptions:
     news_rank: int = 1          # 뉴스 순위 (1-based)
     privacy: str = "private"    # YouTube 공개 설정
     skip_upload: bool = False
+    llm_cache: bool | None = None   # Gemini 응답 캐시 (None이면 MLB_LLM_CACHE 환경변수 기준)
+    refresh_llm: bool = False       # 캐시를 무시하고 대본/메타데이터 새로 생성
+    combined_generation: bool = True  # 대본 + 메타데이터를 Gemini 호출 한 번으로 생성
     # skip_email: bool = False # 의존성 제거
 
 
@@ -112,20 +115,39 @@ def stage_fetch_news(config: dict, callback: StageCallback) -> dict:
 
 def stage_script(
     config: dict, news: dict, options: PipelineOptions, callback: StageCallback
-) -> dict:
-    """Phase 2: 숏폼 대본 생성."""
+) -> tuple[dict, dict | None]:
+    """Phase 2: 숏폼 대본 생성.
+
+    Returns:
+        (대본, 메타데이터) - combined_generation이면 같은 호출에서 받은 메타데이터, 아니면 None
+    """
     callback("script", "start", f"대본 생성 중... (말투: {options.tone}, {options.duration}초)")
 
+    if options.combined_generation:
+        from metadata_generator import generate_script_with_metadata
+        script, metadata = generate_script_with_metadata(
+            api_key=config["GEMINI_API_KEY"],
+            news=news,
+            tone=options.tone,
+            duration=options.duration,
+            use_cache=options.llm_cache,
+            refresh=options.refresh_llm,
+        )
+        callback("script", "done", "대본 + 메타데이터 생성 완료")
+        return script, metadata
+
     from script_generator import generate_script
     script = generate_script(
         api_key=config["GEMINI_API_KEY"],
         news=news,
         tone=options.tone,
         duration=options.duration,
+        use_cache=options.llm_cache,
+        refresh=options.refresh_llm,
     )
 
     callback("script", "done", "대본 생성 완료")
-    return script
+    return script, None
 
 
 def stage_video(
@@ -153,7 +175,7 @@ def stage_video(
 
 
 def stage_metadata(
-    config: dict, script: dict, news: dict, callback: StageCallback
+    config: dict, script: dict, news: dict, options: PipelineOptions, callback: StageCallback
 ) -> dict:
     """Phase 4: 메타데이터 생성."""
     callback("metadata", "start", "메타데이터 생성 중...")
@@ -163,6 +185,8 @@ def stage_metadata(
         api_key=config["GEMINI_API_KEY"],
         script_text=script.get("full_script", ""),
         headline=news.get("headline", ""),
+        use_cache=options.llm_cache,
+        refresh=options.refresh_llm,
     )
 
     callback("metadata", "done", "메타데이터 생성 완료")
@@ -276,7 +300,7 @@ def run_full_pipeline(
     # ── Stage 2: Script ──
     try:
         # 대본 생성 시 전체 뉴스 데이터(트랜잭션 등)를 함께 전달할 수 있도록 확장 가능
-        script = stage_script(config, selected_news, options, callback)
+        script, prefetched_metadata = stage_script(config, selected_news, options, callback)
         result.script = script
         result.stages_completed.append("script")
     except Exception as e:
@@ -299,7 +323,11 @@ def run_full_pipeline(
 
     # ── Stage 4: Metadata ──
     try:
-        metadata = stage_metadata(config, script, selected_news, callback)
+        if prefetched_metadata:
+            metadata = prefetched_metadata
+            callback("metadata", "done", "메타데이터: 대본 생성 응답 사용")
+        else:
+            metadata = stage_metadata(config, script, selected_news, options, callback)
         result.metadata = metadata
         result.stages_completed.append("metadata")
     except Exception as e:
@@ -353,6 +381,11 @@ def main():
     parser.add_argument("--privacy", type=str, default="private",
                         choices=["private", "unlisted", "public"], help="YouTube 공개 설정")
     parser.add_argument("--skip-upload", action="store_true", help="YouTube 업로드 스킵")
+    parser.add_argument("--llm-cache", action="store_true", default=None,
+                        help="같은 뉴스/설정의 Gemini 응답을 로컬 캐시에서 재사용")
+    parser.add_argument("--refresh-llm", action="store_true", help="응답 캐시를 무시하고 새로 생성")
+    parser.add_argument("--separate-metadata", action="store_true",
+                        help="메타데이터를 대본과 별도 호출로 생성 (기본: 한 번의 호출로 함께 생성)")
     # parser.add_argument("--skip-email", action="store_true", help="이메일 발송 스킵") # 의존성 제거
     args = parser.parse_args()
 
@@ -376,6 +409,9 @@ def main():
         news_rank=args.news_rank,
         privacy=args.privacy,
         skip_upload=args.skip_upload,
+        llm_cache=args.llm_cache,
+        refresh_llm=args.refresh_llm,
+        combined_generation=not args.separate_metadata,
         # skip_email=args.skip_email, # 의존성 제거
     )
 
@@ -388,6 +424,8 @@ def main():
         if result.upload_result:
             print(f"  YouTube: {result.upload_result.get('url', '')}")
         print(f"  완료된 스테이지: {', '.join(result.stages_completed)}")
+        from gemini_client import connection_stats
+        print(f"  Gemini: {connection_stats().summary()}")
     else:
         print("  ❌ 파이프라인 실패")
 
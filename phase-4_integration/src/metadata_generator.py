@@ -3,30 +3,66 @@ Gemini API로 업로드 메타데이터 자동 생성
 - YouTube 제목/설명/태그
 - Instagram 캡션/해시태그
 - Twitter 트윗 텍스트
+- 선택: 같은 프롬프트/설정의 응답은 로컬 캐시에서 재사용 (llm_cache)
+- 대본 + 메타데이터를 한 번의 호출로 생성 (generate_script_with_metadata)
+- 응답은 JSON 스키마로 요청하고 검증 (structured_output)
 """
 
-import json
-import re
+import textwrap
 
-from google import genai
-from google.genai import types
+from pydantic import BaseModel, Field
 
-METADATA_PROMPT = """\
-다음 MLB 숏폼 대본을 기반으로 각 소셜 미디어 플랫폼에 맞는 업로드 메타데이터를 생성해주세요.
+# phase-2_app-prototype (app.py / full_pipeline.py가 import 경로에 추가)
+from script_generator import MODEL as SCRIPT_MODEL
+from script_generator import TEMPERATURE as SCRIPT_TEMPERATURE
+from script_generator import JSON_ONLY, NEWS_INFO, SCRIPT_CONDITIONS, SCRIPT_JSON_FIELDS
+from script_generator import ScriptResponse, script_meta, script_prompt_fields
+from structured_output import generate_structured
 
-대본:
-{script}
+MODEL = "gemini-2.0-flash-lite"
+TEMPERATURE = 0.7
+MAX_OUTPUT_TOKENS = 1024
+# 대본 + 메타데이터 동시 생성 (출력이 두 응답을 합친 길이)
+COMBINED_MAX_OUTPUT_TOKENS = 3072
 
-뉴스 제목: {headline}
 
-조건:
+class YoutubeMetadata(BaseModel):
+    title: str = Field(min_length=1)
+    description: str = ""
+    tags: list[str] = Field(default_factory=list)
+
+
+class InstagramMetadata(BaseModel):
+    caption: str = ""
+    hashtags: list[str] = Field(default_factory=list)
+
+
+class TwitterMetadata(BaseModel):
+    tweet_text: str = ""
+
+
+class MetadataResponse(BaseModel):
+    """업로드 메타데이터 응답 형식."""
+
+    youtube: YoutubeMetadata
+    instagram: InstagramMetadata = Field(default_factory=InstagramMetadata)
+    twitter: TwitterMetadata = Field(default_factory=TwitterMetadata)
+
+
+class ScriptWithMetadataResponse(ScriptResponse):
+    """대본 + 메타데이터 동시 생성 응답 형식."""
+
+    metadata: MetadataResponse
+
+
+METADATA_CONDITIONS = """\
 - YouTube 제목은 50자 이내, 클릭을 유도하는 제목
 - YouTube 설명에 #Shorts 태그 포함
 - Instagram 캡션은 이모지 활용, 해시태그 10개
 - Twitter는 280자 이내
+"""
 
-아래 JSON 형식으로만 출력하세요:
-
+METADATA_JSON = """\
 {{
   "youtube": {{
     "title": "영상 제목",
@@ -40,14 +76,75 @@ METADATA_PROMPT = """\
   "twitter": {{
     "tweet_text": "트위터 텍스트"
   }}
-}}
-"""
+}}"""
+
+METADATA_PROMPT = (
+    "다음 MLB 숏폼 대본을 기반으로 각 소셜 미디어 플랫폼에 맞는 업로드 메타데이터를 생성해주세요.\n\n"
+    "대본:\n{script}\n\n"
+    "뉴스 제목: {headline}\n\n"
+    "조건:\n" + METADATA_CONDITIONS
+    + "\n" + JSON_ONLY
+    + METADATA_JSON + "\n"
+)
+
+# 대본 프롬프트와 메타데이터 프롬프트의 조건/JSON 예시를 그대로 합침 (한쪽만 고쳐도 함께 반영)
+COMBINED_PROMPT = (
+    "{tone_description}\n\n"
+    "다음 MLB 뉴스를 기반으로 유튜브 쇼츠/릴스 대본을 작성하고,\n"
+    "그 대본에 맞는 각 소셜 미디어 플랫폼 업로드 메타데이터도 함께 생성해주세요.\n\n"
+    + NEWS_INFO
+    + "\n대본 조건:\n" + SCRIPT_CONDITIONS
+    + "\n메타데이터 조건:\n" + METADATA_CONDITIONS
+    + "\n" + JSON_ONLY
+    + "{{\n" + SCRIPT_JSON_FIELDS + ",\n"
+    + '  "metadata": ' + textwrap.indent(METADATA_JSON, "  ").lstrip() + "\n}}\n"
+)
+
+def generate_script_with_metadata(
+    api_key: str,
+    news: dict,
+    tone: str = "유머러스",
+    duration: int = 30,
+    use_cache: bool | None = None,
+    refresh: bool = False,
+) -> tuple[dict, dict]:
+    """대본과 업로드 메타데이터를 Gemini 호출 한 번으로 생성.
+
+    generate_script + generate_metadata를 차례로 부르는 것과 같은 결과를 내지만,
+    대본 전체를 다시 보내는 두 번째 호출이 없다.
+
+    Args:
+        api_key: Gemini API key
+        news: 뉴스 항목 (headline, summary)
+        tone, duration: generate_script와 같음
+        use_cache: 응답 캐시 사용 여부 (None이면 MLB_LLM_CACHE 환경변수 기준)
+        refresh: True면 캐시를 무시하고 새로 생성 (결과는 캐시에 저장)
+
+    Returns:
+        (대본 dict - generate_script와 같은 형식,
+         메타데이터 dict - generate_metadata와 같은 형식)
+    """
+    prompt = COMBINED_PROMPT.format(**script_prompt_fields(news, tone, duration))
+    response = generate_structured(
+        api_key, ScriptWithMetadataResponse, COMBINED_PROMPT, prompt,
+        model=SCRIPT_MODEL,
+        temperature=SCRIPT_TEMPERATURE,
+        max_output_tokens=COMBINED_MAX_OUTPUT_TOKENS,
+        use_cache=use_cache,
+        refresh=refresh,
+    )
+
+    script = response.model_dump(exclude={"metadata"})
+    script["_meta"] = script_meta(news, tone, duration)
+    return script, response.metadata.model_dump()
 
 
 def generate_metadata(
     api_key: str,
     script_text: str,
     headline: str = "",
+    use_cache: bool | None = None,
+    refresh: bool = False,
 ) -> dict:
     """대본 기반 업로드 메타데이터 생성.
 
@@ -55,28 +152,22 @@ def generate_metadata(
         api_key: Gemini API key
         script_text: 대본 전체 텍스트
         headline: 뉴스 제목
+        use_cache: 응답 캐시 사용 여부 (None이면 MLB_LLM_CACHE 환경변수 기준)
+        refresh: True면 캐시를 무시하고 새로 생성 (결과는 캐시에 저장)
 
     Returns:
         {"youtube": {...}, "instagram": {...}, "twitter": {...}}
     """
-    client = genai.Client(api_key=api_key)
-
     prompt = METADATA_PROMPT.format(
         script=script_text,
         headline=headline,
     )
-
-    response = client.models.generate_content(
-        model="gemini-2.0-flash-lite",
-        contents=prompt,
-        config=types.GenerateContentConfig(
-            temperature=0.7,
-            max_output_tokens=1024,
-        ),
+    metadata = generate_structured(
+        api_key, MetadataResponse, METADATA_PROMPT, prompt,
+        model=MODEL,
+        temperature=TEMPERATURE,
+        max_output_tokens=MAX_OUTPUT_TOKENS,
+        use_cache=use_cache,
+        refresh=refresh,
     )
-
-    raw_text = response.text.strip()
-    json_match = re.search(r"```json\s*(.*?)\s*```", raw_text, re.DOTALL)
-    json_str = json_match.group(1) if json_match else raw_text
-
-    return json.loads(json_str)
+    return metadata.model_dump()